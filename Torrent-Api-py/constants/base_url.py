@@ -2,6 +2,7 @@ X1337 = "https://1337x.to"
 TGX = "https://torrentgalaxy.to"
 TORLOCK = "https://www.torlock.com"
 PIRATEBAY = "https://thepiratebay10.org"
+PIRATEBAY_API = "https://apibay.org"
 NYAASI = "https://nyaa.si"
 ZOOQLE = "https://zooqle.com"
 KICKASS = "https://kickasstorrents.to"
@@ -0,0 +1,39 @@
+import os
+from contextlib import asynccontextmanager
+from aiohttp import web
+
+FIXTURES = os.path.dirname(os.path.abspath(__file__))
+
+# path_qs of every request the fixture server answered
+REQUESTS = []
+
+
+def fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+@web.middleware
+async def _record(request, handler):
+    REQUESTS.append(request.path_qs)
+    return await handler(request)
+
+
+@asynccontextmanager
+async def fixture_server(routes):
+    """
+    Serves `routes`, a list of (path, handler) GET routes, on a free local
+    port and yields its base url. REQUESTS is emptied first.
+    """
+    REQUESTS.clear()
+    app = web.Application(middlewares=[_record])
+    for path, handler in routes:
+        app.router.add_get(path, handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    try:
+        yield "http://127.0.0.1:{}".format(runner.addresses[0][1])
+    finally:
+        await runner.cleanup()
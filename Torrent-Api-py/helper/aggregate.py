@@ -0,0 +1,74 @@
+import heapq
+import itertools
+from .normalize import normalize_infohash, to_int, size_to_bytes, date_to_epoch
+
+# TorrentRecord rows carry size_bytes/timestamp already, plain dicts are parsed
+SORT_KEYS = {
+    "seeders": lambda row: to_int(row.get("seeders")),
+    "leechers": lambda row: to_int(row.get("leechers")),
+    "size": lambda row: row.get("size_bytes") or size_to_bytes(row.get("size")),
+    "date": lambda row: row.get("timestamp") or date_to_epoch(row.get("date")),
+}
+
+
+def row_infohash(row):
+    return normalize_infohash(row.get("hash")) or normalize_infohash(row.get("magnet"))
+
+
+def _populated(row):
+    return sum(1 for value in row.values() if value not in (None, "", [], "N/A"))
+
+
+def _merge_rows(existing, row, site):
+    base, other = (row, existing) if _populated(row) > _populated(existing) else (existing, row)
+    merged = dict(base)
+    for key, value in other.items():
+        if merged.get(key) in (None, "", [], "N/A"):
+            merged[key] = value
+    for key in ("seeders", "leechers"):
+        if key in existing or key in row:
+            merged[key] = max(existing.get(key), row.get(key), key=to_int)
+    merged["hash"] = existing["hash"]
+    merged["sources"] = existing["sources"] + [{"site": site, "url": row.get("url")}]
+    return merged
+
+
+def merge_by_infohash(site_results):
+    """
+    Groups the rows of several sites by infohash.
+
+    `site_results` is an iterable of (site, rows). Rows of the same torrent
+    are merged into one: max seeders/leechers, the fields of the richest row
+    completed by the others and every site with its row url listed in
+    `sources`. Rows without
+    a usable hash are kept as they are. Order follows the first occurrence.
+    """
+    merged = {}
+    for site, rows in site_results:
+        for row in rows:
+            infohash = row_infohash(row)
+            key = infohash if infohash else ("", site, len(merged))
+            if key not in merged:
+                entry = dict(row)
+                if infohash:
+                    entry["hash"] = infohash
+                entry["sources"] = [{"site": site, "url": row.get("url")}]
+                merged[key] = entry
+            else:
+                merged[key] = _merge_rows(merged[key], row, site)
+    return list(merged.values())
+
+
+def top_rows(row_lists, sort=None, top=None):
+    """
+    Selects the `top` best rows of several result lists by `sort` (highest
+    first) with a heap, so only `top` rows are kept. Without `sort` the lists
+    are just chained and cut.
+    """
+    rows = itertools.chain.from_iterable(row_lists)
+    if sort is None:
+        return list(itertools.islice(rows, top)) if top else list(rows)
+    key = SORT_KEYS[sort]
+    if top:
+        return heapq.nlargest(top, rows, key=key)
+    return sorted(rows, key=key, reverse=True)
@@ -0,0 +1,90 @@
+import os
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Consecutive failed scrapes (timeout, blocked, parse error) opening a site's circuit
+FAILURE_THRESHOLD = int(os.environ.get("PYTORRENT_BREAKER_FAILURES", 3))
+# Seconds an open circuit waits before letting one probe request through
+RESET_TIMEOUT = int(os.environ.get("PYTORRENT_BREAKER_RESET", 60))
+
+
+class CircuitBreaker:
+    """
+    Per site breaker: after `failure_threshold` failed scrapes in a row the
+    site is skipped for `reset_timeout` seconds, then a single probe decides
+    whether it closes again or stays open for another round.
+    """
+
+    def __init__(self, failure_threshold=FAILURE_THRESHOLD, reset_timeout=RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.last_status = None
+        self._probing = False
+
+    @property
+    def enabled(self):
+        return self.failure_threshold > 0
+
+    def is_open(self):
+        """True while requests are refused, without claiming the probe."""
+        if not self.enabled or self.state == CLOSED:
+            return False
+        if self.state == OPEN:
+            return time.monotonic() - self.opened_at < self.reset_timeout
+        return self._probing
+
+    def allow(self):
+        """Whether a scrape may run now. In half open only one probe passes."""
+        if self.is_open():
+            return False
+        if self.state != CLOSED:
+            self.state = HALF_OPEN
+            self._probing = True
+        return True
+
+    def release(self):
+        """The probe was cancelled before it finished, let another one through."""
+        self._probing = False
+
+    def record_success(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+
+    def record_failure(self, status):
+        self.failures += 1
+        self.last_status = status
+        self._probing = False
+        if self.state == HALF_OPEN or (
+            self.enabled and self.failures >= self.failure_threshold
+        ):
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+
+    def snapshot(self):
+        retry_in = None
+        if self.state == OPEN:
+            retry_in = max(self.reset_timeout - (time.monotonic() - self.opened_at), 0)
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "last_failure": self.last_status,
+            "retry_in": retry_in,
+        }
+
+
+_breakers = {}
+
+
+def breaker_for(site):
+    site = site.lower()
+    if site not in _breakers:
+        _breakers[site] = CircuitBreaker()
+    return _breakers[site]
@@ -0,0 +1,118 @@
+import os
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+import cloudscraper
+from .latency import timed_fetch
+from .rate_limit import rate_limiter
+from constants.headers import HEADER_AIO
+
+# Threads solving Cloudflare challenges, more requests wait for a free one
+CLOUDFLARE_WORKERS = int(os.environ.get("PYTORRENT_CLOUDFLARE_WORKERS", 2))
+# Seconds a solved clearance is reused before solving again
+CLEARANCE_TTL = int(os.environ.get("PYTORRENT_CLEARANCE_TTL", 1800))
+
+CHALLENGE_STATUSES = (403, 429, 503)
+
+
+def _solve(url, timeout):
+    """Runs in a worker thread: cloudscraper is synchronous."""
+    scraper = cloudscraper.create_scraper()
+    res = scraper.get(url, timeout=timeout)
+    return (
+        res.status_code,
+        res.text,
+        res.headers,
+        scraper.cookies.get_dict(),
+        scraper.headers.get("User-Agent"),
+    )
+
+
+class CloudflareFetcher:
+    """
+    Fetches Cloudflare protected pages without blocking the event loop.
+
+    The first request of a host solves the challenge with cloudscraper in a
+    small thread pool. The clearance cookies and the user agent they were
+    issued for are then kept per host, and later requests go through the
+    shared aiohttp session until Cloudflare challenges again.
+    """
+
+    def __init__(self, workers=CLOUDFLARE_WORKERS):
+        self.workers = workers
+        self._pool = None
+        self._clearance = {}
+        self.solved = 0
+        self.reused = 0
+
+    def _executor(self):
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="cloudflare"
+            )
+        return self._pool
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def _clearance_for(self, host):
+        clearance = self._clearance.get(host)
+        if clearance is None:
+            return None
+        if clearance[2] <= time.monotonic():
+            del self._clearance[host]
+            return None
+        return clearance
+
+    async def get(self, session, url):
+        """Returns (status, html, headers) of `url`."""
+        host = urlsplit(url).netloc.lower()
+        clearance = self._clearance_for(host)
+        if clearance is not None:
+            cookies, user_agent, _ = clearance
+            await rate_limiter.wait(url)
+            with timed_fetch(url) as timeout:
+                async with session.get(
+                    url,
+                    headers={**HEADER_AIO, "User-Agent": user_agent},
+                    cookies=cookies,
+                    timeout=timeout,
+                ) as r:
+                    html = await r.text()
+            if r.status not in CHALLENGE_STATUSES:
+                self.reused += 1
+                return r.status, html, r.headers
+            # * clearance expired or revoked, solve again
+            self._clearance.pop(host, None)
+
+        await rate_limiter.wait(url)
+        loop = asyncio.get_running_loop()
+        with timed_fetch(url) as timeout:
+            status, html, headers, cookies, user_agent = await asyncio.wait_for(
+                loop.run_in_executor(self._executor(), _solve, url, timeout.total),
+                timeout.total,
+            )
+        self.solved += 1
+        if status < 400 and cookies:
+            self._clearance[host] = (
+                cookies,
+                user_agent or HEADER_AIO["User-Agent"],
+                time.monotonic() + CLEARANCE_TTL,
+            )
+        return status, html, headers
+
+    def stats(self):
+        return {
+            "workers": self.workers,
+            "solved": self.solved,
+            "reused": self.reused,
+            "hosts_cleared": sorted(
+                host for host in list(self._clearance) if self._clearance_for(host)
+            ),
+        }
+
+
+cloudflare = CloudflareFetcher()
@@ -0,0 +1,17 @@
+import os
+import json
+
+# Engine used per site keyed by the scraper `_name`, "html" when not listed.
+# The JSON APIs and RSS feeds return every field in one request, without the
+# per row detail pages and soup parsing of the HTML pages.
+# Override with e.g. PYTORRENT_ENGINES='{"YTS": "html"}'
+SITE_ENGINES = {
+    "YTS": "api",
+    "Pirate Bay": "api",
+    "Nyaa": "rss",
+}
+SITE_ENGINES.update(json.loads(os.environ.get("PYTORRENT_ENGINES", "{}")))
+
+
+def engine_for(site):
+    return SITE_ENGINES.get(site, "html")
@@ -0,0 +1,125 @@
+import os
+import asyncio
+import contextvars
+import heapq
+from .enrichment_cache import enrichment_cache
+from .normalize import normalize_infohash
+from .aggregate import SORT_KEYS
+from .release_parser import with_quality
+
+# Detail pages fetched at the same time by one scraper call
+ENRICH_CONCURRENCY = int(os.environ.get("PYTORRENT_ENRICH_CONCURRENCY", 10))
+
+# Rows given their detail page with enrich=top_k
+ENRICH_TOP_K = int(os.environ.get("PYTORRENT_ENRICH_TOP_K", 10))
+
+ENRICH_MODES = ("none", "top_k", "all")
+
+# (sort, top, enrich, quality) of the request being served, see plan_enrichment
+_plan = contextvars.ContextVar("enrichment_plan", default=None)
+
+
+def plan_enrichment(sort=None, top=None, enrich="all", quality=None):
+    """
+    Tells the scrapers called from the current task that only the `top`
+    rows by `sort` of the given `quality` will be kept, so only those need
+    their detail page.
+
+    `enrich` "top_k" narrows that down to the first ENRICH_TOP_K rows and
+    "none" fetches no detail page at all, rows are only filled from the
+    enrichment cache. The other rows come back as the list page has them,
+    their details can be asked for later on /api/v1/details.
+    """
+    if top or enrich != "all" or quality:
+        _plan.set((sort, top, enrich, quality))
+    else:
+        _plan.set(None)
+
+
+def current_plan():
+    return _plan.get()
+
+
+def fetches_details():
+    """False when the current request asked for enrich=none."""
+    plan = _plan.get()
+    return plan is None or plan[2] != "none"
+
+
+def _planned(rows):
+    plan = _plan.get()
+    if plan is None:
+        return rows
+    sort, top, enrich, quality = plan
+    if quality:
+        # * rows of other qualities are filtered out of the response
+        rows = with_quality(rows, quality)
+    if enrich == "top_k":
+        top = min(top or ENRICH_TOP_K, ENRICH_TOP_K)
+    if not top or len(rows) <= top:
+        return rows
+    if sort is None:
+        return rows[:top]
+    if not all(obj.get(sort) not in (None, "") for obj in rows):
+        # * sort field only comes from the detail page, every row is needed
+        return rows if enrich != "top_k" else rows[:top]
+    return heapq.nlargest(top, rows, key=SORT_KEYS[sort])
+
+
+def _added_fields(before, obj):
+    return {
+        key: value for key, value in obj.items() if key not in before or before[key] != value
+    }
+
+
+async def _bounded(sem, coro):
+    async with sem:
+        return await coro
+
+
+async def enrich_rows(site, result, urls, scrap, limit=None):
+    """
+    Fills the rows of `result` with their detail page data.
+
+    The rows are first cut to `limit` and to the current enrichment plan, so
+    no detail page is fetched for a row that gets dropped afterwards, or
+    left out by the request's enrich mode.
+    Rows whose page is in the enrichment cache (by url, or by infohash when
+    the row already has one) are filled from it. The others go through
+    `scrap(url, obj)`, the scraper's `_individual_scrap`, at most
+    ENRICH_CONCURRENCY at a time, and what it added is saved for next time.
+    """
+    if limit:
+        result["data"] = result["data"][:limit]
+    wanted = set(urls)
+    rows = _planned([obj for obj in result["data"] if obj.get("url") in wanted])
+    hashes = {}
+    for obj in rows:
+        infohash = normalize_infohash(obj.get("hash"))
+        if infohash:
+            hashes[obj["url"]] = infohash
+    cached = await enrichment_cache.lookup([obj["url"] for obj in rows], hashes)
+
+    scraped = []
+    tasks = []
+    sem = asyncio.Semaphore(max(ENRICH_CONCURRENCY, 1))
+    for obj in rows:
+        if obj["url"] in cached:
+            obj.update(cached[obj["url"]])
+            continue
+        if not fetches_details():
+            continue
+        scraped.append((obj, dict(obj)))
+        tasks.append(asyncio.create_task(_bounded(sem, scrap(obj["url"], obj))))
+    # * a failed detail page leaves its row as it is
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    entries = []
+    for obj, before in scraped:
+        details = _added_fields(before, obj)
+        if details:
+            entries.append(
+                (obj["url"], normalize_infohash(obj.get("hash")), details)
+            )
+    await enrichment_cache.store(site, entries)
+    return result
@@ -0,0 +1,152 @@
+import os
+import json
+import time
+import sqlite3
+import asyncio
+import tempfile
+import threading
+
+# SQLite file of the detail page cache (temp dir by default), empty disables it
+ENRICHMENT_DB = os.environ.get(
+    "PYTORRENT_ENRICHMENT_DB",
+    os.path.join(tempfile.gettempdir(), "pytorrent_enrichment.sqlite3"),
+)
+# Seconds a detail page stays cached, 0 keeps it forever
+ENRICHMENT_TTL = int(os.environ.get("PYTORRENT_ENRICHMENT_TTL", 30 * 86400))
+
+# Fields another site's row of the same infohash can fill in, the rest
+# (torrent file url, poster, category...) belongs to the site that scraped it
+SHARED_FIELDS = ("magnet", "hash", "files")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS enrichment (
+    url TEXT PRIMARY KEY,
+    infohash TEXT,
+    site TEXT,
+    details TEXT NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS enrichment_infohash ON enrichment (infohash);
+"""
+
+
+class EnrichmentCache:
+    """
+    On disk cache of what `_individual_scrap` adds to a row (magnet, files,
+    poster...), keyed by detail page url and infohash. Detail pages don't
+    change, so a row is only fetched the first time it is seen.
+
+    The database runs in WAL mode so several workers can share the file.
+    Queries run in the default thread pool to keep the event loop free.
+    """
+
+    def __init__(self, path=ENRICHMENT_DB, ttl=ENRICHMENT_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._conn = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    @property
+    def enabled(self):
+        return bool(self.path)
+
+    def _connect(self):
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _min_updated(self):
+        return time.time() - self.ttl if self.ttl > 0 else 0
+
+    def _lookup(self, urls, hashes):
+        found = {}
+        with self._lock:
+            conn = self._connect()
+            for url in urls:
+                row = conn.execute(
+                    "SELECT details FROM enrichment WHERE url = ? AND updated >= ?",
+                    (url, self._min_updated()),
+                ).fetchone()
+                if row is not None:
+                    found[url] = json.loads(row[0])
+            for url, infohash in hashes.items():
+                if url in found:
+                    continue
+                row = conn.execute(
+                    "SELECT details FROM enrichment WHERE infohash = ? AND updated >= ?",
+                    (infohash, self._min_updated()),
+                ).fetchone()
+                if row is not None:
+                    details = json.loads(row[0])
+                    shared = {
+                        key: details[key] for key in SHARED_FIELDS if key in details
+                    }
+                    if shared:
+                        found[url] = shared
+        return found
+
+    def _store(self, site, entries):
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO enrichment VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (url, infohash, site, json.dumps(details), now)
+                        for url, infohash, details in entries
+                    ],
+                )
+
+    async def lookup(self, urls, hashes=None):
+        """
+        Returns {url: details} for the cached `urls`. `hashes` maps urls to
+        known infohashes, used when the url itself isn't cached: only the
+        SHARED_FIELDS of the row found that way are returned.
+        """
+        if not self.enabled or not urls:
+            return {}
+        loop = asyncio.get_running_loop()
+        try:
+            found = await loop.run_in_executor(None, self._lookup, urls, hashes or {})
+        except sqlite3.Error as e:
+            print(f"[ENRICHMENT] Cache lookup failed: {e}")
+            return {}
+        self.hits += len(found)
+        self.misses += len(urls) - len(found)
+        return found
+
+    async def store(self, site, entries):
+        """Saves `entries`, a list of (url, infohash, details)."""
+        if not self.enabled or not entries:
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, self._store, site, entries)
+            self.writes += len(entries)
+        except sqlite3.Error as e:
+            print(f"[ENRICHMENT] Cache write failed: {e}")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self):
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+        }
+
+
+enrichment_cache = EnrichmentCache()
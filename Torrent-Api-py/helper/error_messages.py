@@ -1,5 +1,8 @@
 from fastapi.encoders import jsonable_encoder
+from fastapi import status
 from fastapi.responses import JSONResponse
+from .aggregate import SORT_KEYS
+from .enrichment import ENRICH_MODES
 
 
 def error_handler(status_code, json_message):
@@ -7,3 +10,23 @@ def error_handler(status_code, json_message):
         status_code=status_code,
         content=jsonable_encoder(json_message),
     )
+
+
+def invalid_sort(sort):
+    """400 response for an unknown sort, None when `sort` is valid."""
+    if sort is None or sort in SORT_KEYS:
+        return None
+    return error_handler(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        json_message={"error": "Unknown sort.", "available_sorts": list(SORT_KEYS.keys())},
+    )
+
+
+def invalid_enrich(enrich):
+    """400 response for an unknown enrich mode, None when `enrich` is valid."""
+    if enrich in ENRICH_MODES:
+        return None
+    return error_handler(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        json_message={"error": "Unknown enrich mode.", "available_modes": list(ENRICH_MODES)},
+    )
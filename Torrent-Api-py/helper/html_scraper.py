@@ -2,34 +2,61 @@ import os
 import asyncio
 import aiohttp
 from .asyncioPoliciesFix import decorator_asyncio_fix
+from .site_status import record_fetch, OK, TIMEOUT, BLOCKED
+from .latency import timed_fetch
+from .rate_limit import rate_limiter
+from .single_flight import SingleFlight
 from constants.headers import HEADER_AIO
 
 HTTP_PROXY = os.environ.get("HTTP_PROXY", None)
 
-# Default timeout configuration
-DEFAULT_TIMEOUT = aiohttp.ClientTimeout(
-    total=30,      # Total timeout for entire request
-    connect=10,    # Timeout for connection establishment
-    sock_read=20   # Timeout for reading data
-)
+
+# Concurrent fetches of the same url share one request
+url_flights = SingleFlight()
 
 
 class Scraper:
-    @decorator_asyncio_fix
-    async def _get_html(self, session, url, timeout=None):
+    async def _fetch(self, session, url, timeout, encoding):
+        """Returns (html, fetch status) for `url`."""
         try:
-            timeout_config = timeout or DEFAULT_TIMEOUT
-            async with session.get(url, headers=HEADER_AIO, proxy=HTTP_PROXY, timeout=timeout_config) as r:
-                return await r.text()
+            max_wait = timeout.total if timeout else None
+            for attempt in range(2):
+                await rate_limiter.wait(url, max_wait)
+                with timed_fetch(url, timeout) as timeout_config:
+                    async with session.get(url, headers=HEADER_AIO, proxy=HTTP_PROXY, timeout=timeout_config) as r:
+                        html = await r.text(encoding=encoding)
+                if attempt == 1:
+                    break
+                delay = rate_limiter.backoff(url, r.status, r.headers)
+                if delay is None:
+                    break
+                # * the retry may wait out the Retry-After it was given
+                max_wait = delay + timeout_config.total
+            return html, OK if r.status < 400 else BLOCKED
         except asyncio.TimeoutError:
             print(f"[SCRAPER] Timeout fetching {url}")
-            return None
+            return None, TIMEOUT
         except aiohttp.ClientError as e:
             print(f"[SCRAPER] Client error fetching {url}: {e}")
-            return None
+            return None, BLOCKED
         except Exception as e:
             print(f"[SCRAPER] Error fetching {url}: {e}")
-            return None
+            return None, BLOCKED
+
+    @decorator_asyncio_fix
+    async def _get_html(self, session, url, timeout=None, encoding=None):
+        """
+        Fetches `url`, with a timeout derived from the host's observed latency
+        unless `timeout` is given. `encoding` forces the text decoding.
+        Requests wait for the host's rate limit, and a 429/503 with a short
+        Retry-After is retried once after it. Identical fetches in flight at
+        the same time are coalesced into one.
+        """
+        html, status = await url_flights.do(
+            (url, encoding), self._fetch, session, url, timeout, encoding
+        )
+        record_fetch(status)
+        return html
 
     async def get_all_results(self, session, url, timeout=None):
         return await asyncio.gather(asyncio.create_task(self._get_html(session, url, timeout)))
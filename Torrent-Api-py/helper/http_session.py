@@ -0,0 +1,73 @@
+import os
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+import aiohttp
+
+# Connection pool configuration
+POOL_LIMIT = int(os.environ.get("PYTORRENT_POOL_LIMIT", 100))  # Across all hosts
+POOL_LIMIT_PER_HOST = int(os.environ.get("PYTORRENT_POOL_LIMIT_PER_HOST", 10))
+KEEPALIVE_TIMEOUT = float(os.environ.get("PYTORRENT_KEEPALIVE_TIMEOUT", 60))
+DNS_CACHE_TTL = int(os.environ.get("PYTORRENT_DNS_CACHE_TTL", 300))
+
+
+class SessionManager:
+    """
+    Keeps one ClientSession per upstream host for the lifetime of the app.
+
+    All sessions share a single TCPConnector, which keeps a separate pool of
+    keep-alive connections per host. POOL_LIMIT caps the connections open
+    across every host, POOL_LIMIT_PER_HOST caps each individual site.
+    """
+
+    def __init__(self):
+        self._connector = None
+        self._sessions = {}
+
+    @property
+    def started(self):
+        return self._connector is not None and not self._connector.closed
+
+    async def start(self):
+        if self.started:
+            return
+        self._connector = aiohttp.TCPConnector(
+            limit=POOL_LIMIT,
+            limit_per_host=POOL_LIMIT_PER_HOST,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            use_dns_cache=True,
+            ttl_dns_cache=DNS_CACHE_TTL,
+        )
+
+    async def close(self):
+        for session in self._sessions.values():
+            await session.close()
+        self._sessions.clear()
+        if self._connector is not None:
+            await self._connector.close()
+            self._connector = None
+
+    def get(self, url):
+        host = urlsplit(url).netloc
+        session = self._sessions.get(host)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=self._connector, connector_owner=False
+            )
+            self._sessions[host] = session
+        return session
+
+
+session_manager = SessionManager()
+
+
+@asynccontextmanager
+async def borrow_session(url):
+    """
+    Yields the pooled session for the host of `url`. Outside of the app
+    lifespan (scripts, tests) a throwaway session is used instead.
+    """
+    if session_manager.started:
+        yield session_manager.get(url)
+    else:
+        async with aiohttp.ClientSession() as session:
+            yield session
@@ -15,6 +15,8 @@ from torrents.x1337 import x1337
 from torrents.your_bittorrent import YourBittorrent
 from torrents.yts import Yts
 from torrents.zooqle import Zooqle
+from helper.parser_backend import backend_for
+from helper.engines import engine_for
 
 all_sites = {
     "1337x": {
@@ -266,7 +268,9 @@ all_sites = {
 sites_config = {
     key: {
         **site_info, 
-        "website": site_info["website"]._name
+        "website": site_info["website"]._name,
+        "parser_backend": backend_for(site_info["website"]._name),
+        "engine": engine_for(site_info["website"]._name),
     } for key, site_info in all_sites.items()
 }
 
@@ -0,0 +1,90 @@
+import os
+import time
+import asyncio
+from contextlib import contextmanager
+from collections import deque
+from urllib.parse import urlsplit
+import aiohttp
+
+# Per host timeout = percentile of the last WINDOW response times x FACTOR,
+# clamped to [MIN, MAX] seconds. DEFAULT is used until MIN_SAMPLES are seen.
+TIMEOUT_PERCENTILE = float(os.environ.get("PYTORRENT_TIMEOUT_PERCENTILE", 99))
+TIMEOUT_FACTOR = float(os.environ.get("PYTORRENT_TIMEOUT_FACTOR", 3))
+TIMEOUT_MIN = float(os.environ.get("PYTORRENT_TIMEOUT_MIN", 5))
+TIMEOUT_MAX = float(os.environ.get("PYTORRENT_TIMEOUT_MAX", 60))
+TIMEOUT_DEFAULT = float(os.environ.get("PYTORRENT_TIMEOUT_DEFAULT", 30))
+LATENCY_WINDOW = int(os.environ.get("PYTORRENT_LATENCY_WINDOW", 200))
+MIN_SAMPLES = int(os.environ.get("PYTORRENT_LATENCY_MIN_SAMPLES", 10))
+CONNECT_TIMEOUT = 10
+
+
+class LatencyTracker:
+    """
+    Rolling window of response times per upstream host, used to give fast
+    sites a short timeout and slow but working ones a long enough one.
+
+    A request that timed out is recorded with the timeout it had, so a host
+    getting slower raises its own timeout instead of failing forever.
+    """
+
+    def __init__(self):
+        self._samples = {}
+
+    def _host(self, url):
+        return urlsplit(url).netloc.lower()
+
+    def observe(self, url, elapsed):
+        host = self._host(url)
+        if host not in self._samples:
+            self._samples[host] = deque(maxlen=LATENCY_WINDOW)
+        self._samples[host].append(elapsed)
+
+    def percentile(self, url, percentile=TIMEOUT_PERCENTILE):
+        samples = self._samples.get(self._host(url))
+        if not samples or len(samples) < MIN_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        index = min(int(len(ordered) * percentile / 100), len(ordered) - 1)
+        return ordered[index]
+
+    def timeout_seconds(self, url):
+        observed = self.percentile(url)
+        if observed is None:
+            return TIMEOUT_DEFAULT
+        return min(max(observed * TIMEOUT_FACTOR, TIMEOUT_MIN), TIMEOUT_MAX)
+
+    def timeout_for(self, url):
+        total = self.timeout_seconds(url)
+        return aiohttp.ClientTimeout(
+            total=total, connect=min(CONNECT_TIMEOUT, total), sock_read=total
+        )
+
+    def stats(self):
+        stats = {}
+        for host, samples in self._samples.items():
+            stats[host] = {
+                "samples": len(samples),
+                "p50": self.percentile("//" + host, 50),
+                "p99": self.percentile("//" + host, 99),
+                "timeout": self.timeout_seconds("//" + host),
+            }
+        return stats
+
+
+latency_tracker = LatencyTracker()
+
+
+@contextmanager
+def timed_fetch(url, timeout=None):
+    """
+    `with timed_fetch(url) as timeout:` gives the aiohttp timeout for `url`
+    and records how long the block took, or the timeout when it expired.
+    """
+    timeout = timeout or latency_tracker.timeout_for(url)
+    start = time.monotonic()
+    try:
+        yield timeout
+    except asyncio.TimeoutError:
+        latency_tracker.observe(url, timeout.total or time.monotonic() - start)
+        raise
+    latency_tracker.observe(url, time.monotonic() - start)
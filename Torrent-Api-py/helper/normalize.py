@@ -0,0 +1,147 @@
+import re
+import time
+import base64
+import binascii
+import calendar
+from datetime import datetime
+from urllib.parse import quote
+from constants.trackers import TRACKERS
+
+_BTIH_RE = re.compile(r"urn:btih:([a-zA-Z0-9]{32,40})")
+_HEX40_RE = re.compile(r"^[a-fA-F0-9]{40}$")
+
+
+def to_int(value, default=0):
+    """Parses scraped counters like "1,234", " 56 " or "N/A"."""
+    if isinstance(value, int):
+        return value
+    try:
+        return int(str(value).replace(",", "").strip())
+    except (TypeError, ValueError):
+        return default
+
+
+def normalize_infohash(value):
+    """
+    Returns the lowercase 40 hex infohash from a hash or a magnet link.
+    Base32 (32 chars) hashes are converted, anything else gives None.
+    """
+    if not value:
+        return None
+    value = str(value).strip()
+    if value.startswith("magnet:"):
+        match = _BTIH_RE.search(value)
+        if not match:
+            return None
+        value = match.group(1)
+    if _HEX40_RE.match(value):
+        return value.lower()
+    if len(value) == 32:
+        try:
+            return base64.b32decode(value.upper()).hex()
+        except (binascii.Error, ValueError):
+            return None
+    return None
+
+
+def make_magnet(infohash, name=None):
+    """Builds a magnet link for `infohash` announcing to the shared TRACKERS."""
+    magnet = "magnet:?xt=urn:btih:" + infohash
+    if name:
+        magnet += "&dn=" + quote(name)
+    return magnet + "".join("&tr=" + quote(tracker, safe="") for tracker in TRACKERS)
+
+
+_SIZE_RE = re.compile(r"([\d.,]+)\s*([KMGTP]?)i?B", re.IGNORECASE)
+_SIZE_UNITS = {"": 0, "K": 1, "M": 2, "G": 3, "T": 4, "P": 5}
+
+
+def size_to_bytes(value, default=0):
+    """Parses sizes like "1.4 GB", "700 MiB" or "1,024.5MB" (binary units)."""
+    if isinstance(value, int):
+        return value
+    match = _SIZE_RE.search(str(value or ""))
+    if not match:
+        return default
+    try:
+        number = float(match.group(1).replace(",", ""))
+    except ValueError:
+        return default
+    return int(number * 1024 ** _SIZE_UNITS[match.group(2).upper()])
+
+
+def format_size(num_bytes):
+    """Formats a byte count the way the sites show sizes, e.g. "1.4 GiB"."""
+    size = float(to_int(num_bytes))
+    for unit in ("B", "KiB", "MiB", "GiB", "TiB"):
+        if size < 1024 or unit == "TiB":
+            break
+        size /= 1024
+    return "{} {}".format(int(size) if unit == "B" else round(size, 2), unit)
+
+
+_AGO_RE = re.compile(
+    r"(\d+|an?)\s*(sec|min|hour|hr|day|week|month|year)s?\.?\s*ago", re.IGNORECASE
+)
+_AGO_SECONDS = {
+    "sec": 1,
+    "min": 60,
+    "hour": 3600,
+    "hr": 3600,
+    "day": 86400,
+    "week": 604800,
+    "month": 2592000,
+    "year": 31536000,
+}
+_ORDINAL_RE = re.compile(r"(\d+)(st|nd|rd|th)\b")
+# * the dot of an abbreviated month ("Jan."), not the one of "12.05.2021"
+_ABBREVIATION_DOT_RE = re.compile(r"(?<=[A-Za-z])\.")
+# Formats seen on the scraped sites, tried in order
+_DATE_FORMATS = (
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+    "%d/%m/%y %H:%M",
+    "%m/%d/%Y",
+    "%m-%d %Y",
+    "%m-%d %H:%M",
+    "%b %d '%y",
+    "%b %d %Y",
+    "%d %b %Y",
+    "%B %d %Y",
+    "%d-%m-%Y",
+    "%d.%m.%Y",
+)
+
+
+def date_to_epoch(value, now=None, default=0):
+    """
+    Best effort conversion of the upload dates of every site to a unix
+    timestamp: absolute dates, "Today"/"Y-day" and "3 hours ago" style.
+    """
+    if isinstance(value, (int, float)):
+        return int(value)
+    text = str(value or "").strip()
+    if not text:
+        return default
+    now = now if now is not None else time.time()
+    lowered = text.lower()
+    match = _AGO_RE.search(lowered)
+    if match:
+        amount = 1 if match.group(1) in ("a", "an") else int(match.group(1))
+        return int(now - amount * _AGO_SECONDS[match.group(2)])
+    if lowered.startswith("today"):
+        return int(now)
+    if lowered.startswith(("yesterday", "y-day")):
+        return int(now - 86400)
+    text = _ABBREVIATION_DOT_RE.sub("", _ORDINAL_RE.sub(r"\1", text)).replace(",", "")
+    text = " ".join(text.split())
+    for fmt in _DATE_FORMATS:
+        try:
+            parsed = datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+        if "%Y" not in fmt and "%y" not in fmt:
+            parsed = parsed.replace(year=datetime.fromtimestamp(now).year)
+        return int(calendar.timegm(parsed.timetuple()))
+    return default
@@ -0,0 +1,56 @@
+import os
+import math
+import asyncio
+from .html_scraper import Scraper
+from .parse_executor import parse_executor
+
+# Most pages fetched after the first one to reach a search limit
+MAX_EXTRA_PAGES = int(os.environ.get("PYTORRENT_MAX_EXTRA_PAGES", 5))
+
+
+async def fetch_parsed(session, url, parser, *args):
+    """Fetches `url` and runs the scraper `_parser` on it."""
+    htmls = await Scraper().get_all_results(session, url)
+    return await parse_executor.run(parser, htmls, *args)
+
+
+def _split(parsed):
+    if isinstance(parsed, tuple):
+        return parsed
+    return parsed, None
+
+
+async def extend_with_pages(parsed, page, limit, fetch_page):
+    """
+    `parsed` is what a `_parser` returned for `page`: a result dict or
+    (result, detail urls). When it has fewer than `limit` rows and its
+    `total_pages` says there are more, every page still needed is requested
+    at once with `fetch_page(n)` (returning the same shape). Their rows are
+    merged in page order up to the first empty or failed page and cut at
+    `limit`. Returns `parsed`, extended in place.
+    """
+    result, urls = _split(parsed)
+    if result is None or not limit:
+        return parsed
+    rows = len(result["data"])
+    total_pages = result.get("total_pages")
+    if rows == 0 or rows >= limit or not isinstance(total_pages, int):
+        return parsed
+    # * page size guessed from the first page
+    last = min(page + math.ceil((limit - rows) / rows), total_pages, page + MAX_EXTRA_PAGES)
+    numbers = list(range(page + 1, last + 1))
+    pages = await asyncio.gather(
+        *[fetch_page(number) for number in numbers], return_exceptions=True
+    )
+    for number, other in zip(numbers, pages):
+        if isinstance(other, BaseException):
+            break
+        other_result, other_urls = _split(other)
+        if other_result is None or len(other_result["data"]) == 0:
+            break
+        result["data"].extend(other_result["data"])
+        if urls is not None and other_urls:
+            urls.extend(other_urls)
+        result["current_page"] = number
+    result["data"] = result["data"][:limit]
+    return parsed
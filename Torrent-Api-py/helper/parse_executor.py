@@ -0,0 +1,116 @@
+import os
+import time
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Number of parser processes, 0 parses inline on the event loop
+PARSE_WORKERS = int(os.environ.get("PYTORRENT_PARSE_WORKERS", os.cpu_count() or 1))
+
+# * workers are started on first use or after a crash, when the app already
+# runs threads (resolver, SQLite, cloudflare pool): forking then can deadlock
+START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+def _timed_call(func, args):
+    """Entry point executed inside the worker process."""
+    start = time.perf_counter()
+    try:
+        result, error = func(*args), None
+    except Exception as e:
+        result, error = None, e
+    return result, error, time.perf_counter() - start
+
+
+class ParseExecutor:
+    """
+    Runs the CPU bound BeautifulSoup parsing of every scraper in a pool of
+    worker processes so one big combo request can't stall the event loop.
+
+    `func` must be picklable: a module level function or a bound method of
+    a scraper instance (e.g. `self._parser`) both work.
+    """
+
+    def __init__(self, workers=PARSE_WORKERS):
+        self.workers = workers
+        self._pool = None
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.completed = 0
+        self.failed = 0
+        self.parse_time = 0.0
+        self.max_parse_time = 0.0
+        self.wait_time = 0.0
+
+    @property
+    def started(self):
+        return self._pool is not None
+
+    def start(self):
+        if self._pool is None and self.workers > 0:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context(START_METHOD),
+            )
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def _record(self, elapsed, total):
+        self.completed += 1
+        self.parse_time += elapsed
+        self.max_parse_time = max(self.max_parse_time, elapsed)
+        self.wait_time += max(total - elapsed, 0.0)
+
+    async def run(self, func, *args):
+        start = time.perf_counter()
+        if self._pool is None:
+            result, error, elapsed = _timed_call(func, args)
+            self._record(elapsed, elapsed)
+            if error is not None:
+                raise error
+            return result
+        self.queue_depth += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            loop = asyncio.get_running_loop()
+            result, error, elapsed = await loop.run_in_executor(
+                self._pool, _timed_call, func, args
+            )
+        except BrokenProcessPool:
+            print("[PARSER] Worker pool died, restarting it")
+            self.failed += 1
+            self.shutdown()
+            self.start()
+            result, error, elapsed = _timed_call(func, args)
+        except Exception as e:
+            # Arguments or result could not be pickled, parse inline instead
+            print(f"[PARSER] Falling back to inline parsing: {e}")
+            self.failed += 1
+            result, error, elapsed = _timed_call(func, args)
+        finally:
+            self.queue_depth -= 1
+        self._record(elapsed, time.perf_counter() - start)
+        if error is not None:
+            raise error
+        return result
+
+    def stats(self):
+        return {
+            "workers": self.workers if self._pool is not None else 0,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "completed": self.completed,
+            "failed": self.failed,
+            "avg_parse_time": self.parse_time / self.completed if self.completed else 0,
+            "max_parse_time": self.max_parse_time,
+            "avg_wait_time": self.wait_time / self.completed if self.completed else 0,
+        }
+
+
+parse_executor = ParseExecutor()
@@ -0,0 +1,37 @@
+import os
+import json
+from bs4 import BeautifulSoup, FeatureNotFound
+
+# Tree builder used by sites without an explicit choice
+DEFAULT_BACKEND = os.environ.get("PYTORRENT_PARSER_BACKEND", "html.parser")
+
+# Per site backend keyed by the scraper `_name`. lxml is several times faster
+# than html.parser on the big result tables and gives identical results there.
+# Override with e.g. PYTORRENT_PARSER_BACKENDS='{"Nyaa": "lxml", "1337x": "html.parser"}'
+SITE_BACKENDS = {
+    "1337x": "lxml",
+    "Torrent Galaxy": "lxml",
+    "Tor Lock": "lxml",
+}
+SITE_BACKENDS.update(json.loads(os.environ.get("PYTORRENT_PARSER_BACKENDS", "{}")))
+
+_missing_backends = set()
+
+
+def backend_for(site):
+    return SITE_BACKENDS.get(site, DEFAULT_BACKEND)
+
+
+def make_soup(html, site=None):
+    """
+    Builds the BeautifulSoup tree for `html` with the backend configured for
+    `site`, falling back to html.parser when that backend isn't installed.
+    """
+    backend = backend_for(site)
+    if backend not in _missing_backends:
+        try:
+            return BeautifulSoup(html, backend)
+        except FeatureNotFound:
+            print(f"[PARSER] Backend {backend} not installed, using html.parser")
+            _missing_backends.add(backend)
+    return BeautifulSoup(html, "html.parser")
@@ -0,0 +1,149 @@
+import os
+import json
+import time
+import asyncio
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+from .latency import latency_tracker
+
+# Requests per second and burst allowed per upstream host, rate 0 (default)
+# disables the limit, Retry-After pauses still apply
+DEFAULT_RATE = float(os.environ.get("PYTORRENT_RATE_LIMIT", 0))
+DEFAULT_BURST = int(os.environ.get("PYTORRENT_RATE_BURST", 10))
+# Per host override, e.g. PYTORRENT_RATE_LIMITS='{"1337x.to": {"rate": 2, "burst": 4}}'
+HOST_LIMITS = json.loads(os.environ.get("PYTORRENT_RATE_LIMITS", "{}"))
+# Longest Retry-After (seconds) paused for and waited before retrying a
+# 429/503, a longer one just fails that fetch
+MAX_RETRY_AFTER = float(os.environ.get("PYTORRENT_MAX_RETRY_AFTER", 30))
+
+RETRY_STATUSES = (429, 503)
+
+
+class TokenBucket:
+    """
+    `rate` tokens per second, at most `burst` saved up. Waiters are served
+    in arrival order, so requests queue up instead of failing, unless the
+    host is paused past their `max_wait`: those fail with a timeout at once.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.waiting = 0
+        self._lock = None
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def _check_pause(self, deadline):
+        if deadline is not None and self.paused_until > deadline:
+            raise asyncio.TimeoutError(
+                "host paused for {:.1f}s".format(self.paused_until - time.monotonic())
+            )
+
+    async def acquire(self, max_wait=None):
+        deadline = time.monotonic() + max_wait if max_wait is not None else None
+        self._check_pause(deadline)
+        if self.rate <= 0 and time.monotonic() >= self.paused_until:
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        self.waiting += 1
+        try:
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    if now < self.paused_until:
+                        self._check_pause(deadline)
+                        await asyncio.sleep(self.paused_until - now)
+                        continue
+                    if self.rate <= 0:
+                        return
+                    self._refill(now)
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    await asyncio.sleep((1 - self.tokens) / self.rate)
+        finally:
+            self.waiting -= 1
+
+    def pause(self, seconds):
+        """Upstream asked us to back off: nothing goes out for `seconds`."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0
+
+
+class RateLimiter:
+    def __init__(self):
+        self._buckets = {}
+
+    def _bucket(self, url):
+        host = urlsplit(url).netloc.lower()
+        if host not in self._buckets:
+            limits = HOST_LIMITS.get(host, {})
+            self._buckets[host] = TokenBucket(
+                limits.get("rate", DEFAULT_RATE), limits.get("burst", DEFAULT_BURST)
+            )
+        return self._buckets[host]
+
+    async def wait(self, url, max_wait=None):
+        """
+        Waits for a token of the host of `url`. Raises asyncio.TimeoutError
+        when the host is paused for longer than `max_wait` (by default its
+        request timeout), rather than sleeping past the request's deadline.
+        """
+        if max_wait is None:
+            max_wait = latency_tracker.timeout_seconds(url)
+        await self._bucket(url).acquire(max_wait)
+
+    def backoff(self, url, status, headers):
+        """
+        Pauses the host of `url` after a 429/503 for its Retry-After and
+        returns the delay, so the fetch can wait and retry. A Retry-After over
+        MAX_RETRY_AFTER pauses nothing and returns None: that fetch fails
+        instead of freezing every later request to the host.
+        """
+        if status not in RETRY_STATUSES:
+            return None
+        delay = retry_after_seconds(headers.get("Retry-After"))
+        if delay is None:
+            return None
+        if delay > MAX_RETRY_AFTER:
+            print(f"[RATE LIMIT] {urlsplit(url).netloc} answered {status}, Retry-After {delay:.1f}s too long, not waiting")
+            return None
+        print(f"[RATE LIMIT] {urlsplit(url).netloc} answered {status}, backing off {delay:.1f}s")
+        self._bucket(url).pause(delay)
+        return delay
+
+    def stats(self):
+        return {
+            host: {
+                "rate": bucket.rate,
+                "burst": bucket.burst,
+                "tokens": round(bucket.tokens, 2),
+                "waiting": bucket.waiting,
+                "paused_for": round(max(bucket.paused_until - time.monotonic(), 0), 1),
+            }
+            for host, bucket in self._buckets.items()
+        }
+
+
+def retry_after_seconds(value):
+    """Parses a Retry-After header: delay in seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+rate_limiter = RateLimiter()
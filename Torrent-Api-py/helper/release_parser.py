@@ -0,0 +1,217 @@
+import os
+import re
+from functools import lru_cache
+
+# Distinct release names whose parse is memoized (per process)
+RELEASE_CACHE_SIZE = int(os.environ.get("PYTORRENT_RELEASE_CACHE_SIZE", 4096))
+
+# (value, pattern) tables, first match wins so the specific patterns come first.
+# Patterns run on the name with its "." and "_" separators turned into spaces.
+RESOLUTIONS = (
+    ("2160p", r"2160[pi]|4k|uhd"),
+    ("1440p", r"1440[pi]"),
+    ("1080p", r"1080[pi]|fhd|full ?hd"),
+    ("720p", r"720[pi]"),
+    ("576p", r"576[pi]"),
+    ("480p", r"480[pi]"),
+)
+SOURCES = (
+    ("CAM", r"(?:hd)?cam(?:rip)?"),
+    ("TS", r"(?:hd)?ts|telesync|pdvd"),
+    ("TC", r"(?:hd)?tc|telecine"),
+    ("SCR", r"(?:dvd|bd)?scr(?:eener)?"),
+    ("REMUX", r"(?:bd|uhd)?remux"),
+    ("BluRay", r"blu-?ray|bd-?rip|br-?rip|bd(?:25|50)"),
+    ("WEB-DL", r"web-?dl"),
+    ("WEBRip", r"web-?rip"),
+    ("WEB", r"web"),
+    ("HDTV", r"hdtv|pdtv|dsr"),
+    ("DVDRip", r"dvd-?rip"),
+    ("DVD", r"dvd(?:[59]|r)?"),
+    ("HDRip", r"hd-?rip"),
+)
+CODECS = (
+    ("x265", r"[xh] ?265|hevc"),
+    ("x264", r"[xh] ?264|avc"),
+    ("AV1", r"av1"),
+    ("VP9", r"vp9"),
+    ("XviD", r"xvid"),
+    ("DivX", r"divx"),
+)
+# Every match is kept for these two
+HDR = (
+    ("DV", r"dv|dovi|dolby ?vision"),
+    ("HDR10+", r"hdr10(?:\+|plus)"),
+    ("HDR10", r"hdr10(?![+p])"),
+    ("HDR", r"hdr(?!10)"),
+    ("HLG", r"hlg"),
+)
+AUDIO = (
+    ("DTS-HD MA", r"dts-?hd ?ma"),
+    ("DTS-X", r"dts-?x"),
+    ("DTS", r"dts(?!-?hd|-?x)"),
+    ("TrueHD", r"true-?hd"),
+    ("Atmos", r"atmos"),
+    ("DDP", r"ddp|dd\+|e-?ac-?3"),
+    ("DD", r"dd(?![p+])|ac-?3"),
+    ("AAC", r"aac"),
+    ("FLAC", r"flac"),
+    ("Opus", r"opus"),
+    ("MP3", r"mp3"),
+)
+
+
+def _compile(table, suffix=""):
+    return tuple(
+        (
+            value,
+            re.compile(
+                r"(?<![a-z0-9])(?:{}){}(?![a-z0-9])".format(pattern, suffix),
+                re.IGNORECASE,
+            ),
+        )
+        for value, pattern in table
+    )
+
+
+_RESOLUTIONS = _compile(RESOLUTIONS)
+_SOURCES = _compile(SOURCES)
+_CODECS = _compile(CODECS)
+_HDR = _compile(HDR)
+# * "DDP5.1", "AAC2.0": the channels may be glued to the audio codec
+_AUDIO = _compile(AUDIO, r"(?:[257]\.[01])?")
+_CHANNELS_RE = re.compile(r"(?<![0-9.])([257]\.[01])(?![0-9])")
+_YEAR_RE = re.compile(r"(?<![0-9])[\[(]?((?:19|20)\d{2})[\])]?(?![0-9])")
+_EPISODE_RE = re.compile(r"(?<![a-z0-9])s\d{1,2}(?:e\d{1,3})?(?![a-z0-9])", re.IGNORECASE)
+_EXTENSION_RE = re.compile(r"\.(?:mkv|mp4|avi|m4v|ts|wmv|iso)$", re.IGNORECASE)
+_SEPARATOR_RE = re.compile(r"(?<![0-9])\.|\.(?![0-9])|_")
+_LEADING_GROUP_RE = re.compile(r"^\s*\[([^\]]+)\]\s*")
+_TRAILING_GROUP_RE = re.compile(r"-\s?([A-Za-z0-9]+)(?:\s?\[[^\]]*\])?\s*$")
+
+
+def _first(table, text):
+    """(value, match start) of the first row matching `text`."""
+    for value, pattern in table:
+        match = pattern.search(text)
+        if match:
+            return value, match.start()
+    return None, None
+
+
+def _every(table, text):
+    values, starts = [], []
+    for value, pattern in table:
+        match = pattern.search(text)
+        if match:
+            values.append(value)
+            starts.append(match.start())
+    return values, starts
+
+
+@lru_cache(maxsize=RELEASE_CACHE_SIZE)
+def _parse(name):
+    text = _EXTENSION_RE.sub("", name.strip())
+    group = None
+    leading = _LEADING_GROUP_RE.match(text)
+    if leading:
+        # * anime style "[Group] Title - 01 (1080p)"
+        group = leading.group(1).strip()
+        text = text[leading.end() :]
+    text = _SEPARATOR_RE.sub(" ", text)
+
+    resolution, resolution_at = _first(_RESOLUTIONS, text)
+    source, source_at = _first(_SOURCES, text)
+    codec, codec_at = _first(_CODECS, text)
+    hdr, hdr_at = _every(_HDR, text)
+    audio, audio_at = _every(_AUDIO, text)
+    channels = _CHANNELS_RE.search(text)
+    if channels:
+        audio.append(channels.group(1))
+        audio_at.append(channels.start())
+    episode = _EPISODE_RE.search(text)
+    tags_at = [
+        start
+        for start in [resolution_at, source_at, codec_at, *hdr_at, *audio_at]
+        if start is not None
+    ]
+    if episode:
+        tags_at.append(episode.start())
+    tags_start = min(tags_at) if tags_at else len(text)
+
+    # * the last year before the tags, "2001 A Space Odyssey 1968" is 1968
+    years = [
+        match
+        for match in _YEAR_RE.finditer(text)
+        if 0 < match.start() <= tags_start
+    ]
+    year = int(years[-1].group(1)) if years else None
+    title_end = years[-1].start() if years else tags_start
+
+    if group is None and tags_at:
+        trailing = _TRAILING_GROUP_RE.search(text)
+        if trailing and trailing.start() >= max(tags_at):
+            group = trailing.group(1)
+
+    title = text[:title_end].strip(" -[(")
+    title = " ".join(title.split()) or None
+    return (
+        ("title", title),
+        ("year", year),
+        ("resolution", resolution),
+        ("source", source),
+        ("codec", codec),
+        ("hdr", tuple(hdr)),
+        ("audio", tuple(audio)),
+        ("group", group),
+    )
+
+
+def parse_release(name):
+    """
+    Splits a release name like "Movie.2020.2160p.UHD.BluRay.x265.HDR.DTS-HD.MA.5.1-GROUP"
+    into title, year, resolution, source, codec, hdr, audio and group. Missing
+    parts are None (or empty lists for hdr and audio).
+    """
+    if not name:
+        return None
+    return {
+        key: list(value) if isinstance(value, tuple) else value
+        for key, value in _parse(str(name))
+    }
+
+
+def parse_releases(rows):
+    """
+    Attaches `parsed` to the rows of a whole result list still missing it
+    (plain dicts), repeated names coming from the memo. Returns `rows`.
+    """
+    for row in rows:
+        if row.get("parsed") is None and row.get("name"):
+            row["parsed"] = parse_release(row["name"])
+    return rows
+
+
+def quality_label(parsed):
+    """Resolution, "CAM" for theater captures, else "Unknown"."""
+    if parsed is None:
+        return "Unknown"
+    if parsed["resolution"]:
+        return parsed["resolution"]
+    if parsed["source"] in ("CAM", "TS", "TC"):
+        return "CAM"
+    return "Unknown"
+
+
+def with_quality(rows, quality):
+    """Rows whose quality_label is `quality` (e.g. "1080p", "CAM")."""
+    quality = quality.lower()
+    return [
+        row
+        for row in parse_releases(rows)
+        if quality_label(row.get("parsed")).lower() == quality
+    ]
+
+
+def cache_stats():
+    info = _parse.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize}
@@ -0,0 +1,269 @@
+import os
+import json
+import time
+import asyncio
+from collections import OrderedDict
+from .site_status import track_fetches, current_outcome, record_fetch, OK, CIRCUIT_OPEN
+from .circuit_breaker import breaker_for
+from .single_flight import SingleFlight
+from .enrichment import current_plan
+
+# Max number of cached results, 0 disables the cache
+CACHE_SIZE = int(os.environ.get("PYTORRENT_CACHE_SIZE", 1024))
+
+# Seconds a result stays fresh per endpoint. Trending/recent move quickly,
+# search results barely change in a few minutes.
+# Override with e.g. PYTORRENT_CACHE_TTLS='{"search": 1800, "trending": 60}'
+CACHE_TTLS = {
+    "search": 600,
+    "search_by_category": 600,
+    "trending": 120,
+    "recent": 60,
+}
+CACHE_TTLS.update(json.loads(os.environ.get("PYTORRENT_CACHE_TTLS", "{}")))
+
+# Endpoints served stale-while-revalidate: past their TTL the last good
+# result is still returned at once while one refresh runs in the background.
+SWR_ENDPOINTS = set(
+    os.environ.get("PYTORRENT_CACHE_SWR_ENDPOINTS", "trending,recent").split(",")
+) - {""}
+# How long past its TTL a stale result may still be served
+CACHE_MAX_STALE = int(os.environ.get("PYTORRENT_CACHE_MAX_STALE", 86400))
+
+# Seconds an empty or failed lookup is remembered, 0 disables
+NEGATIVE_TTL = int(os.environ.get("PYTORRENT_NEGATIVE_TTL", 60))
+
+
+def _normalize(value):
+    if isinstance(value, str):
+        return " ".join(value.lower().split())
+    return value
+
+
+def cache_key(site, endpoint, *args):
+    return (site.lower(), endpoint) + tuple(_normalize(arg) for arg in args)
+
+
+class ResultCache:
+    """
+    Size bounded LRU of scraper results where every entry also expires after
+    the TTL of its endpoint. Endpoints in `swr_endpoints` keep their entries
+    for `max_stale` more seconds so a stale copy can be served while it is
+    refreshed.
+    """
+
+    def __init__(
+        self,
+        max_entries=CACHE_SIZE,
+        ttls=CACHE_TTLS,
+        swr_endpoints=SWR_ENDPOINTS,
+        max_stale=CACHE_MAX_STALE,
+        negative_ttl=NEGATIVE_TTL,
+    ):
+        self.max_entries = max_entries
+        self.ttls = ttls
+        self.swr_endpoints = swr_endpoints
+        self.max_stale = max_stale
+        self.negative_ttl = negative_ttl
+        self._entries = OrderedDict()
+        self._negative = OrderedDict()
+        self._refreshing = {}
+        self.hits = {}
+        self.stale_hits = {}
+        self.misses = {}
+        self.negative_hits = {}
+        self.evictions = 0
+        self.refresh_failures = 0
+
+    def _count(self, counter, endpoint):
+        counter[endpoint] = counter.get(endpoint, 0) + 1
+
+    def lookup(self, key):
+        """Returns (value, age, fresh) or None when nothing usable is cached."""
+        endpoint = key[1]
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry[0]
+            ttl = self.ttls.get(endpoint, 0)
+            if age < ttl:
+                self._entries.move_to_end(key)
+                self._count(self.hits, endpoint)
+                return entry[1], age, True
+            if endpoint in self.swr_endpoints and age < ttl + self.max_stale:
+                self._entries.move_to_end(key)
+                self._count(self.stale_hits, endpoint)
+                return entry[1], age, False
+            del self._entries[key]
+        self._count(self.misses, endpoint)
+        return None
+
+    def get(self, key):
+        found = self.lookup(key)
+        return found[0] if found is not None else None
+
+    def set(self, key, value):
+        ttl = self.ttls.get(key[1], 0)
+        if self.max_entries <= 0 or ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def lookup_negative(self, key):
+        """Returns (status, result) of a recent empty/failed lookup or None."""
+        entry = self._negative.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._negative[key]
+            return None
+        self._count(self.negative_hits, key[1])
+        return entry[1], entry[2]
+
+    def set_negative(self, key, status, result):
+        if self.max_entries <= 0 or self.negative_ttl <= 0:
+            return
+        self._negative[key] = (time.monotonic() + self.negative_ttl, status, result)
+        self._negative.move_to_end(key)
+        while len(self._negative) > self.max_entries:
+            self._negative.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+        self._negative.clear()
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "negative_entries": len(self._negative),
+            "negative_hits": self.negative_hits,
+            "evictions": self.evictions,
+            "refreshing": len(self._refreshing),
+            "refresh_failures": self.refresh_failures,
+        }
+
+
+result_cache = ResultCache()
+# Concurrent misses of the same key share one scrape
+site_flights = SingleFlight()
+
+
+def _copy(result):
+    # Routes reorder/cut "data", never hand out the cached dict itself
+    return {**result, "data": list(result["data"])}
+
+
+def _usable(result):
+    return result is not None and len(result.get("data") or []) > 0
+
+
+async def _refresh(key, func, args):
+    try:
+        result = await func(*args)
+    except Exception as e:
+        print(f"[CACHE] Refresh of {key} failed: {e}")
+        result = None
+    if _usable(result):
+        result_cache.set(key, _copy(result))
+    else:
+        # * keep serving the stale copy
+        result_cache.refresh_failures += 1
+
+
+def _schedule_refresh(key, func, args):
+    if key in result_cache._refreshing or breaker_for(key[0]).is_open():
+        return
+    task = asyncio.create_task(_refresh(key, func, args))
+    result_cache._refreshing[key] = task
+    task.add_done_callback(lambda _: result_cache._refreshing.pop(key, None))
+
+
+def _set_age(response, age):
+    if response is None:
+        return
+    current = int(response.headers.get("age", 0))
+    response.headers["Age"] = str(max(current, int(age)))
+
+
+async def _scrape(key, func, args):
+    """Runs the scraper call behind the site's breaker, returns (result, status)."""
+    breaker = breaker_for(key[0])
+    if not breaker.allow():
+        return None, CIRCUIT_OPEN
+    outcome = current_outcome() or track_fetches()
+    try:
+        result = await func(*args)
+    except asyncio.CancelledError:
+        breaker.release()
+        raise
+    except Exception:
+        breaker.record_failure(outcome.status(None))
+        raise
+    status = outcome.status(result)
+    if _usable(result):
+        breaker.record_success()
+        result_cache.set(key, _copy(result))
+    elif result is not None and "data" in result:
+        # * site answered, nothing matched
+        breaker.record_success()
+        result_cache.set_negative(key, OK, _copy(result))
+    else:
+        breaker.record_failure(status)
+        result_cache.set_negative(key, status, None)
+    return result, status
+
+
+async def cached_call(site, endpoint, func, *args, response=None):
+    """
+    Returns `func(*args)` (a scraper `search`, `trending`, `recent` or
+    `search_by_category`) from the cache when a fresh result exists for the
+    same site, endpoint and normalized arguments. Only results with data
+    are cached.
+
+    Stale-while-revalidate endpoints return an expired result right away and
+    refresh it in the background, one refresh per key at a time. When
+    `response` is given its Age header is set for cached results.
+
+    Empty and failed lookups are remembered for a short time and sites with
+    an open circuit are skipped: those calls return at once, the failure
+    being reported again to the site status. Every scrape outcome feeds the
+    site's circuit breaker. Identical calls running at the same time share
+    one scrape.
+    """
+    start_time = time.time()
+    key = cache_key(site, endpoint, *args)
+    if current_plan() is not None:
+        # * only the planned rows got their detail page
+        key = key + (current_plan(),)
+    found = result_cache.lookup(key)
+    if found is not None:
+        cached, age, fresh = found
+        if not fresh:
+            _schedule_refresh(key, func, args)
+        _set_age(response, age)
+        result = _copy(cached)
+        result["time"] = time.time() - start_time
+        return result
+
+    negative = result_cache.lookup_negative(key)
+    if negative is not None:
+        status, result = negative
+        record_fetch(status)
+        if result is None:
+            return None
+        result = _copy(result)
+        result["time"] = time.time() - start_time
+        return result
+
+    result, status = await site_flights.do(key, _scrape, key, func, args)
+    record_fetch(status)
+    if result is not None and "data" in result:
+        # * coalesced callers each get their own copy
+        return _copy(result)
+    return result
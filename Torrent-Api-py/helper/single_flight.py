@@ -0,0 +1,59 @@
+import asyncio
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key: the first caller starts
+    `func(*args)`, the others await that same task. The task is shielded,
+    so one caller being cancelled (deadline, client gone) doesn't cancel it
+    for the rest, it is only cancelled when its last caller is.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        # task -> callers awaiting it
+        self._waiters = {}
+        self.started = 0
+        self.shared = 0
+
+    @property
+    def in_flight(self):
+        return len(self._calls)
+
+    def _done(self, key, task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # * nobody may be left awaiting it, mark the exception as retrieved
+        if not task.cancelled():
+            task.exception()
+
+    async def do(self, key, func, *args):
+        task = self._calls.get(key)
+        if task is None:
+            self.started += 1
+            task = asyncio.ensure_future(func(*args))
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._done(key, done))
+        else:
+            self.shared += 1
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self._waiters[task] == 1 and not task.done():
+                # * nobody wants the result anymore, later calls start afresh
+                if self._calls.get(key) is task:
+                    del self._calls[key]
+                task.cancel()
+            raise
+        finally:
+            self._waiters[task] -= 1
+            if self._waiters[task] == 0:
+                del self._waiters[task]
+
+    def stats(self):
+        return {
+            "in_flight": self.in_flight,
+            "started": self.started,
+            "shared": self.shared,
+        }
@@ -0,0 +1,63 @@
+import contextvars
+
+OK = "ok"
+TIMEOUT = "timeout"
+BLOCKED = "blocked"
+PARSE_ERROR = "parse_error"
+CIRCUIT_OPEN = "circuit_open"
+
+
+class FetchOutcome:
+    """
+    Collects what happened to the upstream fetches of one scrape so a None
+    result can be told apart: site unreachable/blocked vs layout changed.
+    """
+
+    def __init__(self):
+        self.successes = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.skipped = False
+
+    def status(self, result):
+        if result is not None:
+            return OK
+        if self.skipped:
+            return CIRCUIT_OPEN
+        if self.successes == 0 and self.timeouts > 0:
+            return TIMEOUT
+        if self.successes == 0 and self.failures > 0:
+            return BLOCKED
+        return PARSE_ERROR
+
+
+_current_outcome = contextvars.ContextVar("fetch_outcome", default=None)
+
+
+def track_fetches():
+    """
+    Starts recording fetches for the current task. Tasks spawned from it
+    inherit the context and report into the same FetchOutcome.
+    """
+    outcome = FetchOutcome()
+    _current_outcome.set(outcome)
+    return outcome
+
+
+def current_outcome():
+    return _current_outcome.get()
+
+
+def record_fetch(status):
+    outcome = _current_outcome.get()
+    if outcome is None:
+        return
+    if status == CIRCUIT_OPEN:
+        outcome.skipped = True
+    elif status in (OK, PARSE_ERROR):
+        # * a parse error still means the page was fetched
+        outcome.successes += 1
+    elif status == TIMEOUT:
+        outcome.timeouts += 1
+    else:
+        outcome.failures += 1
@@ -0,0 +1,135 @@
+from .normalize import to_int, size_to_bytes, date_to_epoch, normalize_infohash
+from .release_parser import parse_release
+
+
+class TorrentRecord:
+    """
+    One scraped torrent, normalized once at parse time: integer seeders and
+    leechers, `size_bytes` next to the displayed size, `timestamp` next to the
+    displayed date and a lowercase 40 hex `hash` (taken from the magnet when
+    the site gives none). `parsed` holds the release name split by
+    helper.release_parser (resolution, source, codec...).
+
+    Fields shared by the sites live in slots, site specific ones (genre,
+    language, files...) in a small dict. It reads and writes like the dict
+    the scrapers used to build, so `obj["magnet"] = ...`, `obj.update(...)`
+    and `dict(obj)` / jsonable_encoder keep working. Only the keys that were
+    set are serialized.
+    """
+
+    __slots__ = (
+        "name",
+        "size",
+        "size_bytes",
+        "date",
+        "timestamp",
+        "seeders",
+        "leechers",
+        "category",
+        "uploader",
+        "url",
+        "hash",
+        "magnet",
+        "torrent",
+        "poster",
+        "screenshot",
+        "parsed",
+        "_extra",
+    )
+
+    def __init__(self, fields=None, **kwargs):
+        self._extra = None
+        if fields:
+            self.update(fields)
+        if kwargs:
+            self.update(kwargs)
+
+    def __setitem__(self, key, value):
+        if key in ("seeders", "leechers"):
+            value = to_int(value)
+        elif key == "size":
+            self.size_bytes = size_to_bytes(value)
+        elif key == "date":
+            self.timestamp = date_to_epoch(value)
+        elif key == "name":
+            self.parsed = parse_release(value)
+        elif key == "hash":
+            value = normalize_infohash(value) or value
+        elif key == "magnet" and "hash" not in self:
+            infohash = normalize_infohash(value)
+            if infohash:
+                self.hash = infohash
+        if key in _FIELDS:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __getitem__(self, key):
+        if key in _FIELDS:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key)
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __delitem__(self, key):
+        if key in _FIELDS:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key)
+        elif self._extra is None:
+            raise KeyError(key)
+        else:
+            del self._extra[key]
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def keys(self):
+        keys = [key for key in _FIELD_ORDER if hasattr(self, key)]
+        if self._extra:
+            keys.extend(self._extra)
+        return keys
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def values(self):
+        return [self[key] for key in self.keys()]
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def update(self, fields):
+        for key, value in dict(fields).items():
+            self[key] = value
+
+    def __eq__(self, other):
+        if isinstance(other, (TorrentRecord, dict)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    def __repr__(self):
+        return "TorrentRecord({!r})".format(dict(self.items()))
+
+
+_FIELD_ORDER = TorrentRecord.__slots__[:-1]
+_FIELDS = frozenset(_FIELD_ORDER)
@@ -10,19 +10,39 @@ from routers.v1.combo_routers import router as combo_router
 from routers.v1.sites_list_router import router as site_list_router
 from routers.home_router import router as home_router
 from routers.v1.search_url_router import router as search_url_router
+from routers.v1.metrics_router import router as metrics_router
+from routers.v1.details_router import router as details_router
 from helper.uptime import getUptime
 from helper.dependencies import authenticate_request
+from helper.http_session import session_manager
+from helper.parse_executor import parse_executor
+from helper.enrichment_cache import enrichment_cache
+from helper.cloudflare import cloudflare
 from mangum import Mangum
+from contextlib import asynccontextmanager
 from math import ceil
 import time
 
 startTime = time.time()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await session_manager.start()
+    parse_executor.start()
+    yield
+    parse_executor.shutdown()
+    await session_manager.close()
+    enrichment_cache.close()
+    cloudflare.shutdown()
+
+
 app = FastAPI(
     title="Torrent-Api-Py",
     version="1.0.1",
     description="Unofficial Torrent-Api",
     docs_url="/docs",
+    lifespan=lifespan,
     contact={
         "name": "Author",
         "url": "https://github.com/author",
@@ -64,6 +84,8 @@ app.include_router(recent_router, prefix="/api/v1/recent", dependencies=[Depends
 app.include_router(combo_router, prefix="/api/v1/all", dependencies=[Depends(authenticate_request)])
 app.include_router(site_list_router, prefix="/api/v1/sites", dependencies=[Depends(authenticate_request)])
 app.include_router(search_url_router, prefix="/api/v1/search_url", dependencies=[Depends(authenticate_request)])
+app.include_router(metrics_router, prefix="/api/v1/metrics", dependencies=[Depends(authenticate_request)])
+app.include_router(details_router, prefix="/api/v1/details", dependencies=[Depends(authenticate_request)])
 app.include_router(home_router, prefix="")
 
 handler = Mangum(app)
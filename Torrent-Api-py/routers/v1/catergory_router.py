@@ -3,6 +3,7 @@ from fastapi import status
 from typing import Optional
 from helper.is_site_available import check_if_site_available
 from helper.error_messages import error_handler
+from helper.result_cache import cached_call
 
 router = APIRouter(tags=["Category Torrents Route"])
 
@@ -36,8 +37,15 @@ async def get_category(
                         "available_categories": all_sites[site]["categories"],
                     },
                 )
-            resp = await all_sites[site]["website"]().search_by_category(
-                query, category, page, limit
+            website = all_sites[site]["website"]()
+            resp = await cached_call(
+                site,
+                "search_by_category",
+                website.search_by_category,
+                query,
+                category,
+                page,
+                limit,
             )
             if resp is None:
                 return error_handler(
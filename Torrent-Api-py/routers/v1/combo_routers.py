@@ -1,127 +1,262 @@
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Query, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from typing import Optional
 from helper.is_site_available import check_if_site_available
+import json
 import time
 import asyncio
-from helper.error_messages import error_handler
+from helper.error_messages import error_handler, invalid_sort, invalid_enrich
+from helper.result_cache import cached_call
+from helper.enrichment import plan_enrichment
+from helper.site_status import track_fetches, TIMEOUT
+from helper.aggregate import merge_by_infohash, top_rows
+from helper.release_parser import with_quality
 
 
 router = APIRouter(tags=["Combo Routes"])
 
+STREAM_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "sse": "text/event-stream"}
 
-@router.get("/search")
-async def get_search_combo(query: str, limit: Optional[int] = 0):
-    start_time = time.time()
-    query = query.lower()
+
+def _site_calls(method, limit, query=None, response=None):
+    """Returns {site: coroutine} for every site supporting `method`."""
+    # * just getting all_sites dictionary
     all_sites = check_if_site_available("1337x")
-    sites_list = list(all_sites.keys())
-    tasks = []
-    COMBO = {"data": []}
-    total_torrents_overall = 0
-    for site in sites_list:
-        limit = (
+    calls = {}
+    for site in all_sites.keys():
+        if not all_sites[site]["website"]:
+            continue
+        if method != "search" and not all_sites[site][method + "_available"]:
+            continue
+        site_limit = (
             all_sites[site]["limit"]
             if limit == 0 or limit > all_sites[site]["limit"]
             else limit
         )
-        tasks.append(
-            asyncio.create_task(
-                all_sites[site]["website"]().search(query, page=1, limit=limit)
+        website = all_sites[site]["website"]()
+        if method == "search":
+            calls[site] = cached_call(site, method, website.search, query, 1, site_limit)
+        else:
+            calls[site] = cached_call(
+                site,
+                method,
+                getattr(website, method),
+                None,
+                1,
+                site_limit,
+                response=response,
             )
-        )
-    results = await asyncio.gather(*tasks)
-    for res in results:
-        if res is not None and len(res["data"]) > 0:
-            for torrent in res["data"]:
-                COMBO["data"].append(torrent)
-            total_torrents_overall = total_torrents_overall + res["total"]
-    COMBO["time"] = time.time() - start_time
-    COMBO["total"] = total_torrents_overall
-    if total_torrents_overall == 0:
-        return error_handler(
-            status_code=status.HTTP_404_NOT_FOUND,
-            json_message={"error": "Result not found."},
-        )
-    return COMBO
+    return calls
 
 
-@router.get("/trending")
-async def get_all_trending(limit: Optional[int] = 0):
+async def _timed(site, coro):
     start_time = time.time()
-    # * just getting all_sites dictionary
-    all_sites = check_if_site_available("1337x")
-    sites_list = [
-        site
-        for site in all_sites.keys()
-        if all_sites[site]["trending_available"] and all_sites[site]["website"]
-    ]
-    tasks = []
+    outcome = track_fetches()
+    try:
+        res = await coro
+    except Exception as e:
+        print(f"[COMBO] {site} failed: {e}")
+        res = None
+    return site, res, {"status": outcome.status(res), "time": time.time() - start_time}
+
+
+def _deadline(deadline_ms):
+    return deadline_ms / 1000 if deadline_ms else None
+
+
+async def _run_combo(
+    calls, deadline_ms=None, dedupe=False, sort=None, top=None, quality=None
+):
+    start_time = time.time()
+    tasks = {
+        asyncio.create_task(_timed(site, coro)): site for site, coro in calls.items()
+    }
+    done, pending = await asyncio.wait(tasks.keys(), timeout=_deadline(deadline_ms))
+    # Sites still running at the deadline are dropped
+    for task in pending:
+        task.cancel()
     COMBO = {"data": []}
+    sites = {}
+    site_results = []
     total_torrents_overall = 0
-    for site in sites_list:
-        limit = (
-            all_sites[site]["limit"]
-            if limit == 0 or limit > all_sites[site]["limit"]
-            else limit
-        )
-        tasks.append(
-            asyncio.create_task(
-                all_sites[site]["website"]().trending(
-                    category=None, page=1, limit=limit
-                )
-            )
-        )
-    results = await asyncio.gather(*tasks)
-    for res in results:
+    for task, site in tasks.items():
+        if task in pending:
+            sites[site] = {"status": TIMEOUT, "time": time.time() - start_time}
+            continue
+        _, res, sites[site] = task.result()
+        if res is not None and quality:
+            res["data"] = with_quality(res["data"], quality)
+            res["total"] = len(res["data"])
         if res is not None and len(res["data"]) > 0:
-            for torrent in res["data"]:
-                COMBO["data"].append(torrent)
+            site_results.append((site, res["data"]))
             total_torrents_overall = total_torrents_overall + res["total"]
+    if dedupe:
+        # * same release found on several sites is returned once
+        row_lists = [merge_by_infohash(site_results)]
+    else:
+        row_lists = [data for _, data in site_results]
+    if dedupe or sort or top:
+        COMBO["data"] = top_rows(row_lists, sort, top)
+        total_torrents_overall = len(COMBO["data"])
+    else:
+        for data in row_lists:
+            COMBO["data"].extend(data)
     COMBO["time"] = time.time() - start_time
     COMBO["total"] = total_torrents_overall
+    COMBO["sites"] = sites
     if total_torrents_overall == 0:
         return error_handler(
             status_code=status.HTTP_404_NOT_FOUND,
-            json_message={"error": "Result not found."},
+            json_message={"error": "Result not found.", "sites": sites},
         )
     return COMBO
 
 
-@router.get("/recent")
-async def get_all_recent(limit: Optional[int] = 0):
+def _frame(event, payload, stream_format):
+    data = json.dumps(jsonable_encoder({"type": event, **payload}))
+    if stream_format == "sse":
+        return "event: {}\ndata: {}\n\n".format(event, data)
+    return data + "\n"
+
+
+async def _stream_combo(method, limit, query, stream_format, deadline_ms=None):
     start_time = time.time()
-    # just getting all_sites dictionary
-    all_sites = check_if_site_available("1337x")
-    sites_list = [
-        site
-        for site in all_sites.keys()
-        if all_sites[site]["recent_available"] and all_sites[site]["website"]
-    ]
-    tasks = []
-    COMBO = {"data": []}
+    calls = _site_calls(method, limit, query)
+    tasks = [asyncio.create_task(_timed(site, coro)) for site, coro in calls.items()]
+    sites = {}
     total_torrents_overall = 0
-    for site in sites_list:
-        limit = (
-            all_sites[site]["limit"]
-            if limit == 0 or limit > all_sites[site]["limit"]
-            else limit
-        )
-        tasks.append(
-            asyncio.create_task(
-                all_sites[site]["website"]().recent(category=None, page=1, limit=limit)
-            )
+    try:
+        try:
+            for next_done in asyncio.as_completed(
+                tasks, timeout=_deadline(deadline_ms)
+            ):
+                site, res, sites[site] = await next_done
+                data = res["data"] if res is not None else []
+                total_torrents_overall += len(data)
+                yield _frame(
+                    "site",
+                    {"site": site, **sites[site], "total": len(data), "data": data},
+                    stream_format,
+                )
+        except asyncio.TimeoutError:
+            for site in calls.keys():
+                if site not in sites:
+                    sites[site] = {"status": TIMEOUT, "time": time.time() - start_time}
+                    yield _frame(
+                        "site",
+                        {"site": site, **sites[site], "total": 0, "data": []},
+                        stream_format,
+                    )
+        yield _frame(
+            "summary",
+            {
+                "sites": sites,
+                "time": time.time() - start_time,
+                "total": total_torrents_overall,
+            },
+            stream_format,
         )
-    results = await asyncio.gather(*tasks)
-    for res in results:
-        if res is not None and len(res["data"]) > 0:
-            for torrent in res["data"]:
-                COMBO["data"].append(torrent)
-            total_torrents_overall = total_torrents_overall + res["total"]
-    COMBO["time"] = time.time() - start_time
-    COMBO["total"] = total_torrents_overall
-    if total_torrents_overall == 0:
+    finally:
+        # Deadline hit or client went away before every site finished
+        for task in tasks:
+            task.cancel()
+
+
+def _stream_response(method, limit, query, stream_format, deadline_ms):
+    if stream_format not in STREAM_MEDIA_TYPES:
         return error_handler(
-            status_code=status.HTTP_404_NOT_FOUND,
-            json_message={"error": "Result not found."},
+            status_code=status.HTTP_400_BAD_REQUEST,
+            json_message={
+                "error": "Unknown stream format.",
+                "available_formats": list(STREAM_MEDIA_TYPES.keys()),
+            },
         )
-    return COMBO
+    return StreamingResponse(
+        _stream_combo(method, limit, query, stream_format, deadline_ms),
+        media_type=STREAM_MEDIA_TYPES[stream_format],
+    )
+
+
+@router.get("/search")
+async def get_search_combo(
+    query: str,
+    limit: Optional[int] = 0,
+    deadline_ms: Optional[int] = None,
+    dedupe: Optional[bool] = False,
+    sort: Optional[str] = None,
+    top: Optional[int] = Query(None, ge=1),
+    enrich: Optional[str] = "all",
+    quality: Optional[str] = None,
+):
+    query = query.lower()
+    error = invalid_sort(sort) or invalid_enrich(enrich)
+    if error:
+        return error
+    plan_enrichment(sort, top, enrich, quality)
+    return await _run_combo(
+        _site_calls("search", limit, query), deadline_ms, dedupe, sort, top, quality
+    )
+
+
+@router.get("/search/stream")
+async def get_search_combo_stream(
+    query: str,
+    limit: Optional[int] = 0,
+    stream_format: Optional[str] = Query("ndjson", alias="format"),
+    deadline_ms: Optional[int] = None,
+):
+    query = query.lower()
+    return _stream_response("search", limit, query, stream_format, deadline_ms)
+
+
+@router.get("/trending")
+async def get_all_trending(
+    response: Response,
+    limit: Optional[int] = 0,
+    deadline_ms: Optional[int] = None,
+    dedupe: Optional[bool] = False,
+    enrich: Optional[str] = "all",
+):
+    error = invalid_enrich(enrich)
+    if error:
+        return error
+    plan_enrichment(enrich=enrich)
+    return await _run_combo(
+        _site_calls("trending", limit, response=response), deadline_ms, dedupe
+    )
+
+
+@router.get("/trending/stream")
+async def get_all_trending_stream(
+    limit: Optional[int] = 0,
+    stream_format: Optional[str] = Query("ndjson", alias="format"),
+    deadline_ms: Optional[int] = None,
+):
+    return _stream_response("trending", limit, None, stream_format, deadline_ms)
+
+
+@router.get("/recent")
+async def get_all_recent(
+    response: Response,
+    limit: Optional[int] = 0,
+    deadline_ms: Optional[int] = None,
+    dedupe: Optional[bool] = False,
+    enrich: Optional[str] = "all",
+):
+    error = invalid_enrich(enrich)
+    if error:
+        return error
+    plan_enrichment(enrich=enrich)
+    return await _run_combo(
+        _site_calls("recent", limit, response=response), deadline_ms, dedupe
+    )
+
+
+@router.get("/recent/stream")
+async def get_all_recent_stream(
+    limit: Optional[int] = 0,
+    stream_format: Optional[str] = Query("ndjson", alias="format"),
+    deadline_ms: Optional[int] = None,
+):
+    return _stream_response("recent", limit, None, stream_format, deadline_ms)
@@ -0,0 +1,91 @@
+import os
+import time
+import asyncio
+from typing import List
+from urllib.parse import urlsplit
+from fastapi import APIRouter, Body, status
+from helper.is_site_available import check_if_site_available
+from helper.error_messages import error_handler
+from helper.http_session import borrow_session
+from helper.enrichment import plan_enrichment
+from helper.torrent_record import TorrentRecord
+
+router = APIRouter(tags=["Torrent Details"])
+
+# Detail urls accepted in one request
+MAX_DETAIL_URLS = int(os.environ.get("PYTORRENT_MAX_DETAIL_URLS", 50))
+
+
+def _host(url):
+    host = urlsplit(url).netloc.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def _detail_sites():
+    """Returns {host: (site, website)} for the sites having detail pages."""
+    # * just getting all_sites dictionary
+    all_sites = check_if_site_available("1337x")
+    hosts = {}
+    for site in all_sites.keys():
+        if not all_sites[site]["website"]:
+            continue
+        website = all_sites[site]["website"]()
+        if hasattr(website, "_get_torrent"):
+            hosts[_host(website.BASE_URL)] = (site, website)
+    return hosts
+
+
+async def _site_details(website, urls):
+    website.LIMIT = None
+    result = {"data": [TorrentRecord({"url": url}) for url in urls]}
+    async with borrow_session(website.BASE_URL) as session:
+        # * goes through the enrichment cache and its bounded concurrency
+        await website._get_torrent(result, session, urls)
+    return result["data"]
+
+
+@router.post("/")
+@router.post("")
+async def get_details(urls: List[str] = Body(..., embed=True)):
+    """
+    Detail page data (magnet, hash, files, poster...) of a batch of rows,
+    e.g. the ones a user opened after a search with enrich=none.
+    """
+    start_time = time.time()
+    urls = list(dict.fromkeys(urls))
+    if len(urls) > MAX_DETAIL_URLS:
+        return error_handler(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            json_message={"error": "Too many urls.", "max_urls": MAX_DETAIL_URLS},
+        )
+    plan_enrichment()
+    hosts = _detail_sites()
+    by_site = {}
+    unsupported = []
+    for url in urls:
+        host = _host(url)
+        if host in hosts:
+            site, website = hosts[host]
+            by_site.setdefault(site, (website, []))[1].append(url)
+        else:
+            unsupported.append(url)
+
+    sites = list(by_site.keys())
+    results = await asyncio.gather(
+        *[_site_details(*by_site[site]) for site in sites], return_exceptions=True
+    )
+    rows = {}
+    for site, data in zip(sites, results):
+        if isinstance(data, Exception):
+            print(f"[DETAILS] {site} failed: {data}")
+            continue
+        for obj in data:
+            obj["site"] = site
+            rows[obj["url"]] = obj
+    data = [rows[url] for url in urls if url in rows]
+    return {
+        "data": data,
+        "unsupported": unsupported,
+        "time": time.time() - start_time,
+        "total": len(data),
+    }
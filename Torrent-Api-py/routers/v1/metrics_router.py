@@ -0,0 +1,31 @@
+from fastapi import APIRouter, status
+from helper.parse_executor import parse_executor
+from helper.enrichment_cache import enrichment_cache
+from helper.latency import latency_tracker
+from helper.rate_limit import rate_limiter
+from helper.html_scraper import url_flights
+from helper.cloudflare import cloudflare
+from helper.result_cache import result_cache, site_flights
+from helper.error_messages import error_handler
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/")
+@router.get("")
+async def get_metrics():
+    return error_handler(
+        status_code=status.HTTP_200_OK,
+        json_message={
+            "parse_executor": parse_executor.stats(),
+            "result_cache": result_cache.stats(),
+            "enrichment_cache": enrichment_cache.stats(),
+            "upstream_latency": latency_tracker.stats(),
+            "rate_limits": rate_limiter.stats(),
+            "cloudflare": cloudflare.stats(),
+            "coalesced": {
+                "sites": site_flights.stats(),
+                "urls": url_flights.stats(),
+            },
+        },
+    )
@@ -1,8 +1,12 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 from typing import Optional
 from helper.is_site_available import check_if_site_available
 from fastapi import status
-from helper.error_messages import error_handler
+from helper.error_messages import error_handler, invalid_sort, invalid_enrich
+from helper.result_cache import cached_call
+from helper.enrichment import plan_enrichment
+from helper.aggregate import top_rows
+from helper.release_parser import with_quality
 
 router = APIRouter(tags=["Search"])
 
@@ -10,10 +14,20 @@ router = APIRouter(tags=["Search"])
 @router.get("/")
 @router.get("")
 async def search_for_torrents(
-    site: str, query: str, limit: Optional[int] = 0, page: Optional[int] = 1
+    site: str,
+    query: str,
+    limit: Optional[int] = 0,
+    page: Optional[int] = 1,
+    sort: Optional[str] = None,
+    top: Optional[int] = Query(None, ge=1),
+    enrich: Optional[str] = "all",
+    quality: Optional[str] = None,
 ):
     site = site.lower()
     query = query.lower()
+    error = invalid_sort(sort) or invalid_enrich(enrich)
+    if error:
+        return error
     all_sites = check_if_site_available(site)
     if all_sites:
         limit = (
@@ -22,7 +36,9 @@ async def search_for_torrents(
             else limit
         )
 
-        resp = await all_sites[site]["website"]().search(query, page, limit)
+        website = all_sites[site]["website"]()
+        plan_enrichment(sort, top, enrich, quality)
+        resp = await cached_call(site, "search", website.search, query, page, limit)
 
         if resp is None:
             # Parser failed completely
@@ -39,7 +55,13 @@ async def search_for_torrents(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 json_message={"error": "Invalid response from scraper", "site": site},
             )
-        elif len(resp["data"]) > 0:
+        if quality:
+            resp["data"] = with_quality(resp["data"], quality)
+            resp["total"] = len(resp["data"])
+        if len(resp["data"]) > 0:
+            if sort or top:
+                resp["data"] = top_rows([resp["data"]], sort, top)
+                resp["total"] = len(resp["data"])
             return resp
         else:
             # Valid response but no results
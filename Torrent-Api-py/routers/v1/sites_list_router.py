@@ -1,6 +1,7 @@
 from fastapi import APIRouter, status
 from helper.is_site_available import check_if_site_available, sites_config
 from helper.error_messages import error_handler
+from helper.circuit_breaker import breaker_for
 
 router = APIRouter(tags=["Get all sites"])
 
@@ -21,5 +22,8 @@ async def get_all_supported_sites():
 async def get_site_config():
     return error_handler(
         status_code=status.HTTP_200_OK,
-        json_message=sites_config
+        json_message={
+            site: {**config, "circuit": breaker_for(site).snapshot()}
+            for site, config in sites_config.items()
+        },
     )
@@ -1,8 +1,10 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from fastapi import status
 from typing import Optional
 from helper.is_site_available import check_if_site_available
-from helper.error_messages import error_handler
+from helper.error_messages import error_handler, invalid_enrich
+from helper.result_cache import cached_call
+from helper.enrichment import plan_enrichment
 
 router = APIRouter(tags=["Trending Torrents"])
 
@@ -10,14 +12,19 @@ router = APIRouter(tags=["Trending Torrents"])
 @router.get("/")
 @router.get("")
 async def get_trending(
+    response: Response,
     site: str,
     limit: Optional[int] = 0,
     category: Optional[str] = None,
     page: Optional[int] = 1,
+    enrich: Optional[str] = "all",
 ):
     site = site.lower()
     all_sites = check_if_site_available(site)
     category = category.lower() if category is not None else None
+    error = invalid_enrich(enrich)
+    if error:
+        return error
     if all_sites:
         limit = (
             all_sites[site]["limit"]
@@ -42,7 +49,17 @@ async def get_trending(
                         "available_categories": all_sites[site]["categories"],
                     },
                 )
-            resp = await all_sites[site]["website"]().trending(category, page, limit)
+            website = all_sites[site]["website"]()
+            plan_enrichment(enrich=enrich)
+            resp = await cached_call(
+                site,
+                "trending",
+                website.trending,
+                category,
+                page,
+                limit,
+                response=response,
+            )
             if resp is None:
                 return error_handler(
                     status_code=status.HTTP_403_FORBIDDEN,
@@ -0,0 +1,65 @@
+import base64
+from helper.aggregate import merge_by_infohash, top_rows
+from helper.normalize import size_to_bytes, date_to_epoch
+from helper.torrent_record import TorrentRecord
+
+HASH = "c9e15763f722f23e98a29decdfae341b98d53056"
+BASE32 = base64.b32encode(bytes.fromhex(HASH)).decode()
+
+
+def test_merge_by_infohash():
+    rows = merge_by_infohash(
+        [
+            ("1337x", [{"name": "A", "seeders": "1,200", "leechers": "3", "hash": HASH.upper(), "size": "",
+                        "url": "https://1337x.to/torrent/1/a/"}]),
+            ("nyaa", [{"name": "A", "seeders": "900", "leechers": "10", "size": "1 GB",
+                       "url": "https://nyaa.si/view/2",
+                       "magnet": "magnet:?xt=urn:btih:{}&dn=A".format(BASE32)}]),
+            ("tgx", [{"name": "no hash"}]),
+        ]
+    )
+    assert len(rows) == 2
+    assert rows[0]["hash"] == HASH
+    assert rows[0]["seeders"] == "1,200" and rows[0]["leechers"] == "10"
+    assert rows[0]["size"] == "1 GB"
+    # * the merged row keeps the richest url, every site's url stays in sources
+    assert rows[0]["sources"] == [
+        {"site": "1337x", "url": "https://1337x.to/torrent/1/a/"},
+        {"site": "nyaa", "url": "https://nyaa.si/view/2"},
+    ]
+    assert rows[1] == {"name": "no hash", "sources": [{"site": "tgx", "url": None}]}
+    print("merge_by_infohash OK")
+
+
+def test_top_rows():
+    site_a = [{"name": "a", "seeders": "12", "size": "700 MB", "date": "2023-01-05 12:34"}]
+    site_b = [
+        {"name": "b", "seeders": "1,204", "size": "1.4 GB", "date": "Jan. 5th '22"},
+        {"name": "c", "seeders": "N/A", "size": "N/A", "date": "N/A"},
+    ]
+    assert [r["name"] for r in top_rows([site_a, site_b], "seeders", 2)] == ["b", "a"]
+    assert [r["name"] for r in top_rows([site_a, site_b], "size")] == ["b", "a", "c"]
+    assert [r["name"] for r in top_rows([site_a, site_b], "date", 1)] == ["a"]
+    assert len(top_rows([site_a, site_b], None, 2)) == 2
+    assert size_to_bytes("700 MiB") == 700 * 1024 ** 2
+    assert date_to_epoch("3 hours ago", now=100000) == 100000 - 3 * 3600
+    assert date_to_epoch("12.05.2021") == date_to_epoch("2021-05-12")
+    assert date_to_epoch("Jan. 5th '22") == date_to_epoch("2022-01-05")
+    print("top_rows OK")
+
+
+def test_torrent_record():
+    record = TorrentRecord({"name": "A", "seeders": "1,234", "size": "1.4 GB", "genre": ["x"]})
+    record["magnet"] = "magnet:?xt=urn:btih:{}&dn=A".format(BASE32)
+    assert record["seeders"] == 1234
+    assert record["size_bytes"] == int(1.4 * 1024 ** 3)
+    assert record["hash"] == HASH
+    assert "leechers" not in record and record.get("genre") == ["x"]
+    assert dict(record)["name"] == "A"
+    print("TorrentRecord OK")
+
+
+if __name__ == "__main__":
+    test_merge_by_infohash()
+    test_top_rows()
+    test_torrent_record()
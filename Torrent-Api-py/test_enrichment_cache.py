@@ -0,0 +1,39 @@
+import os
+import asyncio
+import tempfile
+from helper.enrichment_cache import EnrichmentCache
+
+HASH = "c9e15763f722f23e98a29decdfae341b98d53056"
+
+
+def test_infohash_fill_is_site_independent():
+    async def run(path):
+        cache = EnrichmentCache(path)
+        details = {
+            "magnet": "magnet:?xt=urn:btih:" + HASH,
+            "files": ["a.mkv"],
+            "torrent": "https://1337x.to/a.torrent",
+            "poster": "https://1337x.to/a.jpg",
+            "category": "Movies",
+        }
+        await cache.store("1337x", [("https://1337x.to/torrent/1/a/", HASH, details)])
+        found = await cache.lookup(
+            ["https://1337x.to/torrent/1/a/", "https://nyaa.si/view/2"],
+            {"https://nyaa.si/view/2": HASH},
+        )
+        cache.close()
+        return found
+
+    with tempfile.TemporaryDirectory() as tmp:
+        found = asyncio.run(run(os.path.join(tmp, "cache.sqlite3")))
+    assert found["https://1337x.to/torrent/1/a/"]["poster"] == "https://1337x.to/a.jpg"
+    # * another site's row only gets the fields that don't depend on the site
+    assert found["https://nyaa.si/view/2"] == {
+        "magnet": "magnet:?xt=urn:btih:" + HASH,
+        "files": ["a.mkv"],
+    }
+    print("enrichment cache OK")
+
+
+if __name__ == "__main__":
+    test_infohash_fill_is_site_independent()
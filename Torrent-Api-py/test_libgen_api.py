@@ -0,0 +1,39 @@
+import asyncio
+from aiohttp import web
+from torrents.libgen import Libgen
+from fixtures.server import fixture_server, fixture, REQUESTS
+
+
+async def fake_libgen(request):
+    """Stands in for libgen: the search listing and the json.php batch lookup."""
+    if request.path == "/json.php":
+        return web.Response(text=fixture("libgen_books.json"), content_type="application/json")
+    return web.Response(text=fixture("libgen_search.html"), content_type="text/html")
+
+
+async def search_against_fixture_server(query, limit):
+    async with fixture_server(
+        [("/search.php", fake_libgen), ("/json.php", fake_libgen)]
+    ) as base_url:
+        scraper = Libgen()
+        scraper.BASE_URL = base_url
+        return await scraper.search(query, 1, limit), scraper.BASE_URL
+
+
+def test_libgen_batch_lookup():
+    result, base_url = asyncio.run(search_against_fixture_server("python", 2))
+    # * one listing and one json.php call, no detail page
+    assert [path.split("?")[0] for path in REQUESTS] == ["/search.php", "/json.php"]
+    assert "ids=1372510,2140013&" in REQUESTS[1]
+    assert result["total"] == 2
+    first, second = result["data"]
+    assert first["name"] == "Learning Python" and first["authors"] == ["Mark Lutz"]
+    assert first["torrent"] == base_url + "/book/index.php?md5=0B3A2B8D11E8B71C3B1A1E0C2F4BCE9D&oftorrent="
+    assert first["poster"] == "http://library.lol/covers/1372000/0b3a2b8d11e8b71c3b1a1e0c2f4bce9d-g.jpg"
+    assert second["authors"] == ["Luciano Ramalho", "Someone"]
+    assert "torrent" in second and "poster" not in second
+    print("Libgen batch lookup OK")
+
+
+if __name__ == "__main__":
+    test_libgen_batch_lookup()
@@ -0,0 +1,85 @@
+import asyncio
+from aiohttp import web
+from helper import engines
+from torrents.nyaa_si import NyaaSi
+from fixtures.server import fixture_server, fixture, REQUESTS
+
+
+async def fake_nyaa(request):
+    """Stands in for nyaa.si: the RSS feed (broken for "broken") and the html listing."""
+    if request.query.get("page") == "rss":
+        if request.query.get("q") == "broken":
+            return web.Response(text="<rss><channel><item>", content_type="application/rss+xml")
+        return web.Response(text=fixture("nyaa_rss.xml"), content_type="application/rss+xml")
+    return web.Response(text=fixture("nyaa_search.html"), content_type="text/html")
+
+
+async def run_against_fixture_server(calls):
+    previous = engines.SITE_ENGINES.get(NyaaSi._name)
+    engines.SITE_ENGINES[NyaaSi._name] = "rss"
+    try:
+        async with fixture_server([("/", fake_nyaa)]) as base_url:
+            results = []
+            for method, args in calls:
+                scraper = NyaaSi()
+                scraper.BASE_URL = base_url
+                results.append(await getattr(scraper, method)(*args))
+            return results, list(REQUESTS)
+    finally:
+        engines.SITE_ENGINES[NyaaSi._name] = previous
+
+
+def test_rss_parser():
+    scraper = NyaaSi()
+    scraper.LIMIT = 2
+    result = scraper._rss_parser([fixture("nyaa_rss.xml")])
+    # * parsing stops at LIMIT
+    assert len(result["data"]) == 2
+    first = result["data"][0]
+    assert first["name"] == "[SubsPlease] Sousou no Frieren - 28 (1080p) [A1B2C3D4].mkv"
+    assert first["seeders"] == 1523 and first["leechers"] == 87
+    assert first["downloads"] == "20411"
+    assert first["size"] == "1.4 GiB" and first["category"] == "Anime"
+    assert first["hash"] == "5f1f2b8a7c0b3d2e9a4c6e8f0a1b2c3d4e5f6a7b"
+    assert first["magnet"].startswith("magnet:?xt=urn:btih:5f1f2b8a7c0b3d2e9a4c6e8f0a1b2c3d4e5f6a7b&dn=")
+    assert first["url"] == "https://nyaa.si/view/1790001"
+    assert first["torrent"] == "https://nyaa.si/download/1790001.torrent"
+    assert first["date"] == "2024-03-22 17:01"
+    assert first["parsed"]["resolution"] == "1080p" and first["parsed"]["group"] == "SubsPlease"
+    scraper.LIMIT = None
+    assert len(scraper._rss_parser([fixture("nyaa_rss.xml")])["data"]) == 3
+    assert scraper._rss_parser(["<rss><channel><item>"]) is None
+    print("Nyaa rss parser OK")
+
+
+def test_rss_engine_and_html_fallback():
+    (search, fallback, recent), requests = asyncio.run(
+        run_against_fixture_server(
+            [
+                ("search", ("frieren", 1, 2)),
+                ("search", ("broken", 1, 50)),
+                ("recent", (None, 1, 50)),
+            ]
+        )
+    )
+    assert requests == [
+        "/?page=rss&f=0&c=0_0&q=frieren",
+        "/?page=rss&f=0&c=0_0&q=broken",
+        "/?f=0&c=0_0&q=broken&p=1",
+        "/?page=rss",
+    ]
+    assert search["total"] == 2 and search["data"][1]["size"] == "700.3 MiB"
+    # * a feed that doesn't parse falls back to the html listing
+    assert fallback["total"] == 2
+    row = fallback["data"][1]
+    assert row["name"] == "Frieren Beyond Journey's End Vol. 1 (Digital)"
+    assert row["hash"] == "ffeeddccbbaa99887766554433221100ffeeddcc"
+    assert row["category"] == "Literature" and row["seeders"] == 35
+    assert row["url"].endswith("/view/1790003")
+    assert recent["total"] == 3
+    print("Nyaa rss engine OK")
+
+
+if __name__ == "__main__":
+    test_rss_parser()
+    test_rss_engine_and_html_fallback()
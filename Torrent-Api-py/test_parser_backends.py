@@ -0,0 +1,58 @@
+import os
+from bs4 import BeautifulSoup, FeatureNotFound
+from helper import parser_backend
+from torrents.x1337 import x1337
+from torrents.torrent_galaxy import TorrentGalaxy
+from torrents.torlock import Torlock
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# (scraper class, saved page, extra _parser arguments)
+CASES = [
+    (x1337, "1337x_search.html", ()),
+    (TorrentGalaxy, "tgx_search.html", ()),
+    (Torlock, "torlock_search.html", (5,)),
+]
+
+
+def available_backends():
+    backends = []
+    for backend in ("html.parser", "lxml", "html5lib"):
+        try:
+            BeautifulSoup("<p></p>", backend)
+            backends.append(backend)
+        except FeatureNotFound:
+            continue
+    return backends
+
+
+def parse_with(backend, site_cls, page, args):
+    with open(os.path.join(FIXTURES, page), encoding="utf-8") as f:
+        html = f.read()
+    scraper = site_cls()
+    scraper.LIMIT = 50
+    previous = parser_backend.SITE_BACKENDS.get(scraper._name)
+    parser_backend.SITE_BACKENDS[scraper._name] = backend
+    try:
+        return scraper._parser([html], *args)
+    finally:
+        if previous is None:
+            parser_backend.SITE_BACKENDS.pop(scraper._name)
+        else:
+            parser_backend.SITE_BACKENDS[scraper._name] = previous
+
+
+def test_backends_match_html_parser():
+    for site_cls, page, args in CASES:
+        expected = parse_with("html.parser", site_cls, page, args)
+        data = expected[0]["data"] if isinstance(expected, tuple) else expected["data"]
+        assert len(data) > 0, page
+        for backend in available_backends():
+            result = parse_with(backend, site_cls, page, args)
+            assert result == expected, "{} differs with {}".format(page, backend)
+            print(f"{site_cls._name}: {backend} OK ({len(data)} rows)")
+
+
+if __name__ == "__main__":
+    print(f"Available backends: {available_backends()}")
+    test_backends_match_html_parser()
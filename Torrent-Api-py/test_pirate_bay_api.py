@@ -0,0 +1,72 @@
+import asyncio
+from aiohttp import web
+from helper import engines
+from torrents.pirate_bay import PirateBay
+from fixtures.server import fixture_server, fixture, REQUESTS
+
+
+async def fake_apibay(request):
+    """Stands in for apibay: q.php and the precompiled top 100 lists."""
+    if request.path == "/q.php" and request.query["q"] == "nothing":
+        body = fixture("apibay_no_results.json")
+    else:
+        body = fixture("apibay_search.json")
+    return web.Response(text=body, content_type="application/json")
+
+
+async def run_against_fixture_server(calls):
+    previous = engines.SITE_ENGINES.get(PirateBay._name)
+    engines.SITE_ENGINES[PirateBay._name] = "api"
+    try:
+        async with fixture_server(
+            [("/q.php", fake_apibay), ("/precompiled/{name}", fake_apibay)]
+        ) as base_url:
+            results = []
+            for method, args in calls:
+                scraper = PirateBay()
+                scraper.API_URL = base_url
+                results.append(await getattr(scraper, method)(*args))
+            return results, list(REQUESTS)
+    finally:
+        engines.SITE_ENGINES[PirateBay._name] = previous
+
+
+def test_pirate_bay_api_engine():
+    (search, page_two, empty, trending, recent), requests = asyncio.run(
+        run_against_fixture_server(
+            [
+                ("search", ("ubuntu", 1, 2)),
+                ("search", ("ubuntu", 2, 2)),
+                ("search", ("nothing", 1, 50)),
+                ("trending", (None, 1, 50)),
+                ("recent", ("tv", 1, 50)),
+            ]
+        )
+    )
+    assert requests == [
+        "/q.php?q=ubuntu",
+        "/q.php?q=ubuntu",
+        "/q.php?q=nothing",
+        "/precompiled/data_top100_all.json",
+        "/q.php?q=category:205",
+    ]
+    first = search["data"][0]
+    assert search["total"] == 2 and search["total_pages"] == 2
+    assert first["name"] == "Ubuntu 22.04.3 Desktop amd64"
+    assert first["hash"] == "75439d5de343999ab377c617c2c647902956e282"
+    assert first["magnet"].startswith("magnet:?xt=urn:btih:75439D5DE343999AB377C617C2C647902956E282&dn=")
+    assert "&tr=" in first["magnet"]
+    assert first["seeders"] == 1534 and first["leechers"] == 12
+    assert first["size"] == "4.69 GiB" and first["size_bytes"] > 5 * 10 ** 9
+    assert first["category"] == "Applications" and first["uploader"] == "ubuntu"
+    assert first["date"] == "2023-08-10 20:40"
+    assert first["url"].endswith("/description.php?id=68211837")
+    assert [row["name"] for row in page_two["data"]] == ["Ubuntu Linux Bible"]
+    assert page_two["data"][0]["category"] == "Other"
+    assert empty["total"] == 0
+    assert trending["total"] == 3 and recent["total"] == 3
+    print("PirateBay api engine OK")
+
+
+if __name__ == "__main__":
+    test_pirate_bay_api_engine()
@@ -0,0 +1,69 @@
+import time
+import asyncio
+import aiohttp
+from aiohttp import web
+from helper.rate_limit import rate_limiter, TokenBucket, MAX_RETRY_AFTER
+from helper.html_scraper import Scraper
+from fixtures.server import fixture_server, REQUESTS
+
+async def too_many_requests(request):
+    return web.Response(status=429, text="slow down", headers={"Retry-After": "3600"})
+
+
+async def fetch_twice():
+    async with fixture_server([("/{name}", too_many_requests)]) as base_url:
+        async with aiohttp.ClientSession() as session:
+            await Scraper()._get_html(session, base_url + "/first")
+            start = time.monotonic()
+            await Scraper()._get_html(session, base_url + "/second")
+            return time.monotonic() - start, rate_limiter.stats()[base_url[7:]]
+
+
+def test_long_retry_after_fails_fast():
+    elapsed, bucket = asyncio.run(fetch_twice())
+    # * no retry and no hour long pause of the host
+    assert REQUESTS == ["/first", "/second"]
+    assert bucket["paused_for"] == 0
+    assert elapsed < 5
+    print("long Retry-After OK")
+
+
+def test_pause_past_deadline_raises():
+    async def acquire_paused():
+        bucket = TokenBucket(5, 10)
+        bucket.pause(MAX_RETRY_AFTER)
+        start = time.monotonic()
+        try:
+            await bucket.acquire(max_wait=1)
+        except asyncio.TimeoutError:
+            return time.monotonic() - start
+        return None
+
+    elapsed = asyncio.run(acquire_paused())
+    assert elapsed is not None and elapsed < 0.5
+    print("paused bucket OK")
+
+
+def test_unlimited_bucket_keeps_pauses():
+    async def acquire_many():
+        bucket = TokenBucket(0, 10)
+        start = time.monotonic()
+        for _ in range(105):
+            await bucket.acquire()
+        unlimited = time.monotonic() - start
+        bucket.pause(0.2)
+        start = time.monotonic()
+        await bucket.acquire(max_wait=1)
+        return unlimited, time.monotonic() - start
+
+    unlimited, paused = asyncio.run(acquire_many())
+    # * no token wait, a Retry-After still holds the host back
+    assert unlimited < 0.1
+    assert paused >= 0.15
+    print("unlimited bucket OK")
+
+
+if __name__ == "__main__":
+    test_long_retry_after_fails_fast()
+    test_pause_past_deadline_raises()
+    test_unlimited_bucket_keeps_pauses()
@@ -0,0 +1,64 @@
+from helper.release_parser import parse_release, parse_releases, quality_label, with_quality
+from helper.torrent_record import TorrentRecord
+from helper.enrichment import plan_enrichment, _planned
+
+
+def test_parse_release():
+    parsed = parse_release("Movie.Name.2020.2160p.UHD.BluRay.x265.10bit.HDR.DTS-HD.MA.5.1-SWTYBLZ")
+    assert parsed == {
+        "title": "Movie Name",
+        "year": 2020,
+        "resolution": "2160p",
+        "source": "BluRay",
+        "codec": "x265",
+        "hdr": ["HDR"],
+        "audio": ["DTS-HD MA", "5.1"],
+        "group": "SWTYBLZ",
+    }
+    parsed = parse_release("Show.S01E02.1080p.WEB-DL.DDP5.1.Atmos.DV.HDR10+.H.265-FLUX")
+    assert parsed["title"] == "Show" and parsed["source"] == "WEB-DL"
+    assert parsed["hdr"] == ["DV", "HDR10+"] and parsed["audio"] == ["Atmos", "DDP", "5.1"]
+    parsed = parse_release("[SubsPlease] Sousou no Frieren - 01 (1080p) [ABCD1234].mkv")
+    assert parsed["group"] == "SubsPlease" and parsed["resolution"] == "1080p"
+    parsed = parse_release("2001 A Space Odyssey 1968 1080p BluRay x264-GROUP")
+    assert parsed["title"] == "2001 A Space Odyssey" and parsed["year"] == 1968
+    # * "ts" inside a word is no telesync
+    parsed = parse_release("The.Sports.Show.2023.HDTV.x264-GRP")
+    assert parsed["source"] == "HDTV" and quality_label(parsed) == "Unknown"
+    assert quality_label(parse_release("Oppenheimer (2023) HDCAM")) == "CAM"
+    assert parse_release("") is None
+    print("parse_release OK")
+
+
+def test_parsed_rows():
+    names = ["A.2020.720p.WEBRip.x264-X", "B.2021.1080p.BluRay.x264-Y", "A.2020.720p.WEBRip.x264-X"]
+    rows = [TorrentRecord({"name": name}) for name in names]
+    assert [row["parsed"]["resolution"] for row in rows] == ["720p", "1080p", "720p"]
+    assert rows[1]["parsed"]["source"] == "BluRay"
+    rows[0]["parsed"]["title"] = "changed"
+    assert rows[2]["parsed"]["title"] == "A"
+    assert [row["name"] for row in with_quality(rows, "1080P")] == [names[1]]
+    # * plain dict rows get their parse in one pass over the list
+    plain = parse_releases([{"name": name} for name in names] + [{"name": ""}])
+    assert [row.get("parsed", {}).get("resolution") for row in plain] == ["720p", "1080p", "720p", None]
+    print("parsed rows OK")
+
+
+def test_quality_before_top():
+    rows = [
+        TorrentRecord({"name": "Movie.2020.2160p.WEB-DL", "seeders": "90"}),
+        TorrentRecord({"name": "Movie.2020.1080p.WEB-DL", "seeders": "50"}),
+        TorrentRecord({"name": "Movie.2020.720p.WEB-DL", "seeders": "70"}),
+        TorrentRecord({"name": "Movie.2020.1080p.BluRay", "seeders": "10"}),
+    ]
+    # * the top row is picked among the 1080p rows, not cut before the filter
+    plan_enrichment("seeders", 1, "all", "1080p")
+    assert [row["name"] for row in _planned(rows)] == ["Movie.2020.1080p.WEB-DL"]
+    plan_enrichment()
+    assert len(_planned(rows)) == 4
+
+
+if __name__ == "__main__":
+    test_parse_release()
+    test_parsed_rows()
+    test_quality_before_top()
@@ -0,0 +1,56 @@
+import asyncio
+from helper.result_cache import cached_call, site_flights
+from helper.single_flight import SingleFlight
+from routers.v1.combo_routers import _run_combo
+
+EVENTS = []
+
+
+async def slow_search(query, page, limit):
+    try:
+        await asyncio.sleep(0.5)
+        EVENTS.append("finished")
+        return {"data": [{"name": query}], "total": 1}
+    except asyncio.CancelledError:
+        EVENTS.append("cancelled")
+        raise
+
+
+def test_deadline_cancels_scrape():
+    async def run():
+        EVENTS.clear()
+        calls = {"slow": cached_call("slow", "search", slow_search, "deadline", 1, 5)}
+        response = await _run_combo(calls, deadline_ms=50)
+        # * give a shielded scrape the time it would need to finish
+        await asyncio.sleep(0.7)
+        return response
+
+    response = asyncio.run(run())
+    assert response.status_code == 404
+    assert EVENTS == ["cancelled"]
+    assert site_flights.in_flight == 0
+    print("deadline cancels scrape OK")
+
+
+def test_shared_call_survives_one_cancel():
+    async def run():
+        EVENTS.clear()
+        flights = SingleFlight()
+        first = asyncio.ensure_future(flights.do("k", slow_search, "shared", 1, 5))
+        second = asyncio.ensure_future(flights.do("k", slow_search, "shared", 1, 5))
+        await asyncio.sleep(0.05)
+        first.cancel()
+        result = await second
+        return result, flights.stats()
+
+    result, stats = asyncio.run(run())
+    # * the other caller still wanted it
+    assert result["data"] == [{"name": "shared"}]
+    assert EVENTS == ["finished"]
+    assert stats == {"in_flight": 0, "started": 1, "shared": 1}
+    print("shared call OK")
+
+
+if __name__ == "__main__":
+    test_deadline_cancels_scrape()
+    test_shared_call_survives_one_cancel()
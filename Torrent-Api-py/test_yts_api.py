@@ -0,0 +1,69 @@
+import asyncio
+from aiohttp import web
+from helper import engines
+from torrents.yts import Yts
+from fixtures.server import fixture_server, fixture, REQUESTS
+
+
+async def fake_yts(request):
+    """Stands in for the YTS api: list_movies.json and movie_details.json."""
+    if request.path.endswith("/movie_details.json"):
+        body = fixture("yts_movie_details.json")
+    else:
+        body = fixture("yts_list_movies.json")
+    return web.Response(text=body, content_type="application/json")
+
+
+async def run_against_fixture_server(calls):
+    previous = engines.SITE_ENGINES.get(Yts._name)
+    engines.SITE_ENGINES[Yts._name] = "api"
+    try:
+        async with fixture_server([("/api/v2/{name}", fake_yts)]) as base_url:
+            results = []
+            for method, args in calls:
+                scraper = Yts()
+                scraper.API_URL = base_url + "/api/v2"
+                results.append(await getattr(scraper, method)(*args))
+            return results, list(REQUESTS)
+    finally:
+        engines.SITE_ENGINES[Yts._name] = previous
+
+
+def test_yts_api_engine():
+    (search, by_imdb, recent), requests = asyncio.run(
+        run_against_fixture_server(
+            [
+                ("search", ("matrix", 1, 50)),
+                ("search", ("tt0133093", 1, 50)),
+                ("recent", (None, 2, 1)),
+            ]
+        )
+    )
+    assert requests == [
+        "/api/v2/list_movies.json?limit=20&page=1&sort_by=date_added&query_term=matrix",
+        "/api/v2/movie_details.json?imdb_id=tt0133093",
+        "/api/v2/list_movies.json?limit=20&page=2&sort_by=date_added",
+    ]
+    # * movies without a url are skipped, 23 movies make 2 pages
+    assert search["total"] == 2 and search["total_pages"] == 2
+    first = search["data"][0]
+    assert first["name"] == "The Matrix" and first["date"] == "1999"
+    assert first["url"] == "https://yts.mx/movies/the-matrix-1999"
+    assert first["genre"] == ["Action", "Sci-Fi"] and first["rating"] == "8.7"
+    assert first["runtime"] == "2 hr 16 min"
+    assert [t["type"] for t in first["torrents"]] == ["BluRay", "WEB"]
+    torrent = first["torrents"][0]
+    assert torrent["quality"] == "1080p" and torrent["seeders"] == 412
+    assert torrent["magnet"].startswith(
+        "magnet:?xt=urn:btih:5C8A0E1C2E1A6B3D4F5E6A7B8C9D0E1F2A3B4C5D&dn=The%20Matrix%20%281999%29"
+    )
+    assert search["data"][1]["description"] == "Neo and the rebel leaders estimate they have 72 hours."
+    # * one movie, the torrent without a hash is dropped
+    assert by_imdb["total"] == 1 and by_imdb["total_pages"] == 1
+    assert len(by_imdb["data"][0]["torrents"]) == 1
+    assert recent["total"] == 1
+    print("YTS api engine OK")
+
+
+if __name__ == "__main__":
+    test_yts_api_engine()
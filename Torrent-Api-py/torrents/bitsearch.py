@@ -1,8 +1,10 @@
 import re
 import time
-import aiohttp
-from bs4 import BeautifulSoup
 from helper.html_scraper import Scraper
+from helper.http_session import borrow_session
+from helper.parser_backend import make_soup
+from helper.parse_executor import parse_executor
+from helper.torrent_record import TorrentRecord
 from constants.base_url import BITSEARCH
 
 
@@ -15,7 +17,7 @@ class Bitsearch:
     def _parser(self, htmls):
         try:
             for html in htmls:
-                soup = BeautifulSoup(html, "html.parser")
+                soup = make_soup(html, self._name)
                 my_dict = {"data": []}
 
                 # Find all search result divs (new structure uses Tailwind CSS)
@@ -99,7 +101,7 @@ class Bitsearch:
                         if not hash_match:
                             continue
 
-                        my_dict["data"].append({
+                        my_dict["data"].append(TorrentRecord({
                             "name": name,
                             "size": size,
                             "seeders": seeders,
@@ -111,7 +113,7 @@ class Bitsearch:
                             "url": self.BASE_URL + url if not url.startswith("http") else url,
                             "date": date,
                             "downloads": "N/A"  # Not available in new structure
-                        })
+                        }))
 
                         if len(my_dict["data"]) == self.LIMIT:
                             break
@@ -155,7 +157,7 @@ class Bitsearch:
             return None
 
     async def search(self, query, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             url = self.BASE_URL + "/search?q={}&page={}".format(query, page)
@@ -163,7 +165,7 @@ class Bitsearch:
 
     async def parser_result(self, start_time, url, session):
         html = await Scraper().get_all_results(session, url)
-        results = self._parser(html)
+        results = await parse_executor.run(self._parser, html)
         if results is not None:
             results["time"] = time.time() - start_time
             results["total"] = len(results["data"])
@@ -171,7 +173,7 @@ class Bitsearch:
         return results
 
     async def trending(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             url = self.BASE_URL + "/trending"
@@ -1,8 +1,13 @@
 import time
 import asyncio
-import aiohttp
-from bs4 import BeautifulSoup
 from helper.html_scraper import Scraper
+from helper.http_session import borrow_session
+from helper.parser_backend import make_soup
+from helper.parse_executor import parse_executor
+from helper.torrent_record import TorrentRecord
+from helper.site_status import record_fetch, OK, TIMEOUT, BLOCKED
+from helper.latency import timed_fetch
+from helper.rate_limit import rate_limiter
 from helper.asyncioPoliciesFix import decorator_asyncio_fix
 from constants.base_url import GLODLS
 from constants.headers import HEADER_AIO
@@ -19,11 +24,14 @@ class Glodls:
         """Custom HTML fetcher that handles latin-1 encoding for Glodls"""
         print(f"[GLODLS] Fetching URL: {url}")
         try:
-            timeout = aiohttp.ClientTimeout(total=30, connect=10, sock_read=20)
-            async with session.get(url, headers=HEADER_AIO, timeout=timeout) as r:
-                print(f"[GLODLS] Response status: {r.status}")
-                # Read raw bytes first
-                raw_bytes = await r.read()
+            await rate_limiter.wait(url)
+            with timed_fetch(url) as timeout:
+                async with session.get(url, headers=HEADER_AIO, timeout=timeout) as r:
+                    print(f"[GLODLS] Response status: {r.status}")
+                    rate_limiter.backoff(url, r.status, r.headers)
+                    # Read raw bytes first
+                    raw_bytes = await r.read()
+                    record_fetch(OK if r.status < 400 else BLOCKED)
                 print(f"[GLODLS] Read {len(raw_bytes)} bytes")
                 # Decode with latin-1 (the actual encoding Glodls uses)
                 try:
@@ -36,9 +44,11 @@ class Glodls:
                     return raw_bytes.decode('utf-8', errors='ignore')
         except asyncio.TimeoutError:
             print(f"[GLODLS] Timeout fetching {url}")
+            record_fetch(TIMEOUT)
             return None
         except Exception as e:
             print(f"[GLODLS] Error fetching {url}: {e}")
+            record_fetch(BLOCKED)
             import traceback
             traceback.print_exc()
             return None
@@ -65,7 +75,7 @@ class Glodls:
 
                 print(f"[GLODLS] Processing HTML of length {len(html)}")
 
-                soup = BeautifulSoup(html, "html.parser")
+                soup = make_soup(html, self._name)
                 my_dict = {"data": []}
 
                 rows = soup.find_all("tr", class_="t-row")[0:-1:2]
@@ -96,7 +106,7 @@ class Glodls:
                                 continue  # Skip this result
 
                         my_dict["data"].append(
-                            {
+                            TorrentRecord({
                                 "name": name,
                                 "size": size,
                                 "uploader": uploader,
@@ -105,7 +115,7 @@ class Glodls:
                                 "magnet": magnet,
                                 "torrent": self.BASE_URL + torrent,
                                 "url": self.BASE_URL + url,
-                            }
+                            })
                         )
 
                         if len(my_dict["data"]) == self.LIMIT:
@@ -135,7 +145,7 @@ class Glodls:
             return None
 
     async def search(self, query, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             # Use browse.php as fallback - search.php heavily rate-limited
@@ -148,7 +158,7 @@ class Glodls:
     async def parser_result(self, start_time, url, session, query=None):
         # Use custom encoding-aware fetcher instead of default Scraper
         html = await self._get_all_results_custom(session, url)
-        results = self._parser(html, query)
+        results = await parse_executor.run(self._parser, html, query)
         if results is not None:
             results["time"] = time.time() - start_time
             results["total"] = len(results["data"])
@@ -156,14 +166,14 @@ class Glodls:
         return results
 
     async def trending(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             url = self.BASE_URL + "/today.php"
             return await self.parser_result(start_time, url, session)
 
     async def recent(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             url = self.BASE_URL + "/search.php"
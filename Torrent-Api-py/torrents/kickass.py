@@ -1,12 +1,14 @@
-import asyncio
 import re
 import time
-import aiohttp
-from bs4 import BeautifulSoup
 from helper.asyncioPoliciesFix import decorator_asyncio_fix
 from helper.html_scraper import Scraper
+from helper.http_session import borrow_session
+from helper.parser_backend import make_soup
+from helper.parse_executor import parse_executor
+from helper.torrent_record import TorrentRecord
+from helper.enrichment import enrich_rows
+from helper.pages import extend_with_pages, fetch_parsed
 from constants.base_url import KICKASS
-from constants.headers import HEADER_AIO
 
 
 class Kickass:
@@ -18,44 +20,46 @@ class Kickass:
     @decorator_asyncio_fix
     async def _individual_scrap(self, session, url, obj):
         try:
-            async with session.get(url, headers=HEADER_AIO) as res:
-                html = await res.text(encoding="ISO-8859-1")
-                soup = BeautifulSoup(html, "html.parser")
-                try:
-                    poster = soup.find("a", class_="movieCover")
-                    if poster:
-                        poster = poster.find("img")["src"]
-                        obj["poster"] = self.BASE_URL + poster
-                    imgs = (soup.find("div", class_="data")).find_all("img")
-                    if imgs and len(imgs) > 0:
-                        obj["screenshot"] = [img["src"] for img in imgs]
-                    magnet_and_torrent = soup.find_all("a", class_="kaGiantButton")
-                    magnet = magnet_and_torrent[0]["href"]
-                    obj["hash"] = re.search(
-                        r"([{a-f\d,A-F\d}]{32,40})\b", magnet
-                    ).group(0)
-                    obj["magnet"] = magnet
-                except:
-                    ...
+            html = await Scraper()._get_html(session, url, encoding="ISO-8859-1")
+            if html is not None:
+                obj.update(await parse_executor.run(self._parse_details, html))
         except:
             return None
 
+    def _parse_details(self, html):
+        details = {}
+        soup = make_soup(html, self._name)
+        try:
+            poster = soup.find("a", class_="movieCover")
+            if poster:
+                poster = poster.find("img")["src"]
+                details["poster"] = self.BASE_URL + poster
+            imgs = (soup.find("div", class_="data")).find_all("img")
+            if imgs and len(imgs) > 0:
+                details["screenshot"] = [img["src"] for img in imgs]
+            magnet_and_torrent = soup.find_all("a", class_="kaGiantButton")
+            magnet = magnet_and_torrent[0]["href"]
+            details["hash"] = re.search(
+                r"([{a-f\d,A-F\d}]{32,40})\b", magnet
+            ).group(0)
+            details["magnet"] = magnet
+        except:
+            ...
+        return details
+
     async def _get_torrent(self, result, session, urls):
-        tasks = []
-        for idx, url in enumerate(urls):
-            for obj in result["data"]:
-                if obj["url"] == url:
-                    task = asyncio.create_task(
-                        self._individual_scrap(session, url, result["data"][idx])
-                    )
-                    tasks.append(task)
-        await asyncio.gather(*tasks)
-        return result
+        return await enrich_rows(
+            self._name,
+            result,
+            urls,
+            lambda url, obj: self._individual_scrap(session, url, obj),
+            limit=self.LIMIT,
+        )
 
     def _parser(self, htmls):
         try:
             for html in htmls:
-                soup = BeautifulSoup(html, "html.parser")
+                soup = make_soup(html, self._name)
                 list_of_urls = []
                 my_dict = {"data": []}
                 for tr in soup.select("tr.odd,tr.even"):
@@ -71,7 +75,7 @@ class Kickass:
                         date = td[3].text.strip()
 
                         my_dict["data"].append(
-                            {
+                            TorrentRecord({
                                 "name": name,
                                 "size": size,
                                 "date": date,
@@ -79,7 +83,7 @@ class Kickass:
                                 "leechers": leechers,
                                 "url": url,
                                 "uploader": uploader,
-                            }
+                            })
                         )
                     if len(my_dict["data"]) == self.LIMIT:
                         break
@@ -99,15 +103,26 @@ class Kickass:
             return None, None
 
     async def search(self, query, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
-            url = self.BASE_URL + "/usearch/{}/{}/".format(query, page)
-            return await self.parser_result(start_time, url, session)
+            page_url = lambda number: self.BASE_URL + "/usearch/{}/{}/".format(
+                query, number
+            )
+            return await self.parser_result(
+                start_time, page_url(page), session, page, page_url
+            )
 
-    async def parser_result(self, start_time, url, session):
+    async def parser_result(self, start_time, url, session, page=None, page_url=None):
         htmls = await Scraper().get_all_results(session, url)
-        result, urls = self._parser(htmls)
+        result, urls = await parse_executor.run(self._parser, htmls)
+        if result is not None and page_url is not None:
+            result, urls = await extend_with_pages(
+                (result, urls),
+                page,
+                self.LIMIT,
+                lambda number: fetch_parsed(session, page_url(number), self._parser),
+            )
         if result is not None:
             results = await self._get_torrent(result, session, urls)
             results["time"] = time.time() - start_time
@@ -116,7 +131,7 @@ class Kickass:
         return result
 
     async def trending(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             if not category:
@@ -130,7 +145,7 @@ class Kickass:
             return await self.parser_result(start_time, url, session)
 
     async def recent(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             if not category:
@@ -1,11 +1,14 @@
 import asyncio
+import json
 import time
-import aiohttp
-from bs4 import BeautifulSoup
 from helper.asyncioPoliciesFix import decorator_asyncio_fix
 from helper.html_scraper import Scraper
+from helper.http_session import borrow_session
+from helper.parser_backend import make_soup
+from helper.parse_executor import parse_executor
+from helper.torrent_record import TorrentRecord
+from helper.enrichment import enrich_rows, fetches_details
 from constants.base_url import LIBGEN
-from constants.headers import HEADER_AIO
 
 
 class Libgen:
@@ -18,41 +21,76 @@ class Libgen:
     async def _individual_scrap(self, session, url, obj, sem):
         async with sem:
             try:
-                async with session.get(url, headers=HEADER_AIO) as res:
-                    html = await res.text(encoding="ISO-8859-1")
-                    soup = BeautifulSoup(html, "html.parser")
-                    try:
-                        x = soup.find_all("a")
-                        for a in x:
-                            if a.text == "One-filetorrent":
-                                if a["href"] != "#":
-                                    obj["torrent"] = self.BASE_URL + a["href"]
-                        poster = soup.find_all("img")[0]
-
-                        if poster:
-                            obj["poster"] = "http://library.lol" + poster["src"]
-                    except:
-                        ...
+                html = await Scraper()._get_html(session, url, encoding="ISO-8859-1")
+                if html is not None:
+                    obj.update(await parse_executor.run(self._parse_details, html))
             except:
                 return None
 
+    def _parse_details(self, html):
+        details = {}
+        soup = make_soup(html, self._name)
+        try:
+            x = soup.find_all("a")
+            for a in x:
+                if a.text == "One-filetorrent":
+                    if a["href"] != "#":
+                        details["torrent"] = self.BASE_URL + a["href"]
+            poster = soup.find_all("img")[0]
+
+            if poster:
+                details["poster"] = "http://library.lol" + poster["src"]
+        except:
+            ...
+        return details
+
+    def _parse_books(self, payloads):
+        """{id: details} from a json.php answer, torrent and cover built from md5/coverurl."""
+        books = {}
+        try:
+            for payload in payloads:
+                for book in json.loads(payload):
+                    details = {
+                        "torrent": self.BASE_URL
+                        + "/book/index.php?md5={}&oftorrent=".format(book["md5"]),
+                    }
+                    if book.get("coverurl"):
+                        details["poster"] = "http://library.lol/covers/" + book["coverurl"]
+                    books[str(book["id"])] = details
+        except:
+            ...
+        return books
+
     async def _get_torrent(self, result, session, urls):
-        tasks = []
-        sem = asyncio.Semaphore(3)
-        for idx, url in enumerate(urls):
+        """
+        Resolves every row of the listing with one json.php call on their
+        ids. Rows without an id (detail urls given to /api/v1/details) still
+        go through their detail page.
+        """
+        if self.LIMIT:
+            result["data"] = result["data"][: self.LIMIT]
+        ids = [str(obj["id"]).strip() for obj in result["data"] if obj.get("id")]
+        if ids and fetches_details():
+            url = self.BASE_URL + "/json.php?ids={}&fields=id,md5,coverurl".format(
+                ",".join(ids)
+            )
+            payloads = await Scraper().get_all_results(session, url)
+            books = await parse_executor.run(self._parse_books, payloads)
             for obj in result["data"]:
-                if obj["url"] == url:
-                    task = asyncio.create_task(
-                        self._individual_scrap(session, url, result["data"][idx], sem)
-                    )
-                    tasks.append(task)
-        await asyncio.gather(*tasks)
-        return result
+                obj.update(books.get(str(obj.get("id", "")).strip(), {}))
+        sem = asyncio.Semaphore(3)
+        return await enrich_rows(
+            self._name,
+            result,
+            [obj["url"] for obj in result["data"] if not obj.get("id")],
+            lambda url, obj: self._individual_scrap(session, url, obj, sem),
+            limit=self.LIMIT,
+        )
 
     def _parser(self, htmls):
         try:
             for html in htmls:
-                soup = BeautifulSoup(html, "html.parser")
+                soup = make_soup(html, self._name)
                 list_of_urls = []
                 my_dict = {"data": []}
                 trs = soup.select("[valign=top]")
@@ -79,7 +117,7 @@ class Libgen:
                     extension = td[8].text
 
                     my_dict["data"].append(
-                        {
+                        TorrentRecord({
                             "id": id,
                             "authors": authors,
                             "name": name,
@@ -90,7 +128,7 @@ class Libgen:
                             "size": size,
                             "extension": extension,
                             "url": url,
-                        }
+                        })
                     )
                     if len(my_dict["data"]) == self.LIMIT:
                         break
@@ -99,7 +137,7 @@ class Libgen:
             return None, None
 
     async def search(self, query, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             url = (
@@ -112,7 +150,7 @@ class Libgen:
 
     async def parser_result(self, start_time, url, session):
         htmls = await Scraper().get_all_results(session, url)
-        result, urls = self._parser(htmls)
+        result, urls = await parse_executor.run(self._parser, htmls)
         if result is not None:
             results = await self._get_torrent(result, session, urls)
             results["time"] = time.time() - start_time
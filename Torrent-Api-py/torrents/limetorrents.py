@@ -1,12 +1,13 @@
-import asyncio
 import re
 import time
-import aiohttp
-from bs4 import BeautifulSoup
 from helper.asyncioPoliciesFix import decorator_asyncio_fix
 from helper.html_scraper import Scraper
+from helper.http_session import borrow_session
+from helper.parser_backend import make_soup
+from helper.parse_executor import parse_executor
+from helper.torrent_record import TorrentRecord
+from helper.enrichment import enrich_rows
 from constants.base_url import LIMETORRENT
-from constants.headers import HEADER_AIO
 
 
 class Limetorrent:
@@ -18,37 +19,39 @@ class Limetorrent:
     @decorator_asyncio_fix
     async def _individual_scrap(self, session, url, obj):
         try:
-            async with session.get(url, headers=HEADER_AIO) as res:
-                html = await res.text(encoding="ISO-8859-1")
-                soup = BeautifulSoup(html, "html.parser")
-                try:
-                    a_tag = soup.find_all("a", class_="csprite_dltorrent")
-                    obj["torrent"] = a_tag[0]["href"]
-                    obj["magnet"] = a_tag[-1]["href"]
-                    obj["hash"] = re.search(
-                        r"([{a-f\d,A-F\d}]{32,40})\b", obj["magnet"]
-                    ).group(0)
-                except:
-                    ...
+            html = await Scraper()._get_html(session, url, encoding="ISO-8859-1")
+            if html is not None:
+                obj.update(await parse_executor.run(self._parse_details, html))
         except:
             return None
 
+    def _parse_details(self, html):
+        details = {}
+        soup = make_soup(html, self._name)
+        try:
+            a_tag = soup.find_all("a", class_="csprite_dltorrent")
+            details["torrent"] = a_tag[0]["href"]
+            details["magnet"] = a_tag[-1]["href"]
+            details["hash"] = re.search(
+                r"([{a-f\d,A-F\d}]{32,40})\b", details["magnet"]
+            ).group(0)
+        except:
+            ...
+        return details
+
     async def _get_torrent(self, result, session, urls):
-        tasks = []
-        for idx, url in enumerate(urls):
-            for obj in result["data"]:
-                if obj["url"] == url:
-                    task = asyncio.create_task(
-                        self._individual_scrap(session, url, result["data"][idx])
-                    )
-                    tasks.append(task)
-        await asyncio.gather(*tasks)
-        return result
+        return await enrich_rows(
+            self._name,
+            result,
+            urls,
+            lambda url, obj: self._individual_scrap(session, url, obj),
+            limit=self.LIMIT,
+        )
 
     def _parser(self, htmls, idx=0):
         try:
             for html in htmls:
-                soup = BeautifulSoup(html, "html.parser")
+                soup = make_soup(html, self._name)
                 list_of_urls = []
                 my_dict = {"data": []}
 
@@ -66,7 +69,7 @@ class Limetorrent:
                     seeders = td[3].text
                     leechers = td[4].text
                     my_dict["data"].append(
-                        {
+                        TorrentRecord({
                             "name": name,
                             "size": size,
                             "date": date,
@@ -74,7 +77,7 @@ class Limetorrent:
                             "seeders": seeders,
                             "leechers": leechers,
                             "url": url,
-                        }
+                        })
                     )
                     if len(my_dict["data"]) == self.LIMIT:
                         break
@@ -93,7 +96,7 @@ class Limetorrent:
             return None, None
 
     async def search(self, query, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             url = self.BASE_URL + "/search/all/{}//{}".format(query, page)
@@ -101,7 +104,7 @@ class Limetorrent:
 
     async def parser_result(self, start_time, url, session, idx=0):
         htmls = await Scraper().get_all_results(session, url)
-        result, urls = self._parser(htmls, idx)
+        result, urls = await parse_executor.run(self._parser, htmls, idx)
         if result is not None:
             results = await self._get_torrent(result, session, urls)
             results["time"] = time.time() - start_time
@@ -110,14 +113,14 @@ class Limetorrent:
         return result
 
     async def trending(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             url = self.BASE_URL + "/top100"
             return await self.parser_result(start_time, url, session)
 
     async def recent(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             if not category:
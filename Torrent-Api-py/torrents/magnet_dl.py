@@ -1,10 +1,15 @@
 import asyncio
 import re
 import time
-import aiohttp
-import cloudscraper
 import requests
-from bs4 import BeautifulSoup
+from helper.http_session import borrow_session
+from helper.parser_backend import make_soup
+from helper.parse_executor import parse_executor
+from helper.torrent_record import TorrentRecord
+from helper.site_status import record_fetch, OK, TIMEOUT, BLOCKED
+from helper.rate_limit import rate_limiter
+from helper.cloudflare import cloudflare
+from helper.pages import extend_with_pages
 from constants.base_url import MAGNETDL
 
 
@@ -17,7 +22,7 @@ class Magnetdl:
     def _parser(self, htmls):
         try:
             for html in htmls:
-                soup = BeautifulSoup(html, "html.parser")
+                soup = make_soup(html, self._name)
 
                 my_dict = {"data": []}
                 table = soup.find("table", class_="download")
@@ -37,7 +42,7 @@ class Magnetdl:
                             leechers = td[7].get_text(strip=True)
                             category = td[3].text
                             my_dict["data"].append(
-                                {
+                                TorrentRecord({
                                     "name": name,
                                     "size": size,
                                     "seeders": seeders,
@@ -49,7 +54,7 @@ class Magnetdl:
                                     "magnet": magnet,
                                     "url": self.BASE_URL + url,
                                     "date": date,
-                                }
+                                })
                             )
                         if len(my_dict["data"]) == self.LIMIT:
                             break
@@ -82,28 +87,49 @@ class Magnetdl:
             return None
 
     async def _get_html(self, session, url):
-        session = cloudscraper.create_scraper(sess=session)
         try:
-            return session.get(url).text
+            # Cloudflare protected, challenge solved off the event loop
+            status, html, headers = await cloudflare.get(session, url)
+            rate_limiter.backoff(url, status, headers)
+            record_fetch(OK if status < 400 else BLOCKED)
+            return html
+        except asyncio.TimeoutError:
+            record_fetch(TIMEOUT)
+            return None
         except:
+            record_fetch(BLOCKED)
             return None
 
     async def _get_all_results(self, session, url):
         return await asyncio.gather(asyncio.create_task(self._get_html(session, url)))
 
     async def search(self, query, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             query = requests.utils.unquote(query)
             query = query.split(" ")
             query = "-".join(query)
-            url = self.BASE_URL + "/{}/{}/se/desc/{}/".format(query[0], query, page)
-            return await self.parser_result(start_time, url, session)
+            page_url = lambda number: self.BASE_URL + "/{}/{}/se/desc/{}/".format(
+                query[0], query, number
+            )
+            return await self.parser_result(
+                start_time, page_url(page), session, page, page_url
+            )
 
-    async def parser_result(self, start_time, url, session):
+    async def _parse_page(self, session, url):
         data = await self._get_all_results(session, url)
-        results = self._parser(data)
+        return await parse_executor.run(self._parser, data)
+
+    async def parser_result(self, start_time, url, session, page=None, page_url=None):
+        results = await self._parse_page(session, url)
+        if results is not None and page_url is not None:
+            results = await extend_with_pages(
+                results,
+                page,
+                self.LIMIT,
+                lambda number: self._parse_page(session, page_url(number)),
+            )
         if results is not None:
             results["time"] = time.time() - start_time
             results["total"] = len(results["data"])
@@ -111,7 +137,7 @@ class Magnetdl:
         return results
 
     async def recent(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             if not category:
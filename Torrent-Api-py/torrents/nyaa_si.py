@@ -1,13 +1,25 @@
 import re
 import time
-import aiohttp
-from bs4 import BeautifulSoup
+import xml.etree.ElementTree as ET
+from email.utils import parsedate_to_datetime
 from helper.html_scraper import Scraper
+from helper.http_session import borrow_session
+from helper.parser_backend import make_soup
+from helper.parse_executor import parse_executor
+from helper.torrent_record import TorrentRecord
+from helper.pages import extend_with_pages, fetch_parsed
+from helper.engines import engine_for
+from helper.normalize import make_magnet
 from constants.base_url import NYAASI
 
+# Characters of the RSS feed handed to the parser at a time
+RSS_CHUNK = 16 * 1024
+
 
 class NyaaSi:
     _name = "Nyaa"
+    RSS_NS = "{https://nyaa.si/xmlns/nyaa}"
+
     def __init__(self):
         self.BASE_URL = NYAASI
         self.LIMIT = None
@@ -15,7 +27,7 @@ class NyaaSi:
     def _parser(self, htmls):
         try:
             for html in htmls:
-                soup = BeautifulSoup(html, "html.parser")
+                soup = make_soup(html, self._name)
 
                 my_dict = {"data": []}
                 for tr in (soup.find("table")).find_all("tr")[1:]:
@@ -32,7 +44,7 @@ class NyaaSi:
                     downloads = td[7].text
                     category = td[0].find("a")["title"].split("-")[0].strip()
                     my_dict["data"].append(
-                        {
+                        TorrentRecord({
                             "name": name,
                             "size": size,
                             "seeders": seeders,
@@ -46,7 +58,7 @@ class NyaaSi:
                             "url": self.BASE_URL + url,
                             "date": date,
                             "downloads": downloads,
-                        }
+                        })
                     )
                     if len(my_dict["data"]) == self.LIMIT:
                         break
@@ -64,16 +76,89 @@ class NyaaSi:
         except:
             return None
 
+    def _rss_row(self, item):
+        field = lambda name: item.findtext(self.RSS_NS + name, "")
+        infohash = field("infoHash")
+        name = item.findtext("title", "")
+        return TorrentRecord({
+            "name": name,
+            "size": field("size"),
+            "seeders": field("seeders"),
+            "leechers": field("leechers"),
+            "category": field("category").split("-")[0].strip(),
+            "hash": infohash,
+            "magnet": make_magnet(infohash, name),
+            "torrent": item.findtext("link", ""),
+            "url": item.findtext("guid", ""),
+            "date": parsedate_to_datetime(item.findtext("pubDate")).strftime(
+                "%Y-%m-%d %H:%M"
+            ),
+            "downloads": field("downloads"),
+        })
+
+    def _rss_parser(self, feeds):
+        """
+        Parses the RSS feed, whose nyaa:* elements carry the seeders,
+        leechers, downloads, infohash and size. The feed is fed to a pull
+        parser in chunks, each item is cleared once read and parsing stops
+        at LIMIT items.
+        """
+        try:
+            for feed in feeds:
+                my_dict = {"data": [], "current_page": 1, "total_pages": None}
+                parser = ET.XMLPullParser(events=("end",))
+                for start in range(0, len(feed), RSS_CHUNK):
+                    parser.feed(feed[start : start + RSS_CHUNK])
+                    for _, elem in parser.read_events():
+                        if elem.tag != "item":
+                            continue
+                        my_dict["data"].append(self._rss_row(elem))
+                        elem.clear()
+                        if len(my_dict["data"]) == self.LIMIT:
+                            return my_dict
+                parser.close()
+                return my_dict
+        except:
+            return None
+
+    async def _rss_result(self, start_time, url, session):
+        feeds = await Scraper().get_all_results(session, url)
+        results = await parse_executor.run(self._rss_parser, feeds)
+        if results is not None:
+            results["time"] = time.time() - start_time
+            results["total"] = len(results["data"])
+        return results
+
     async def search(self, query, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
-            url = self.BASE_URL + "/?f=0&c=0_0&q={}&p={}".format(query, page)
-            return await self.parser_result(start_time, url, session)
+            # * the feed has no pages, later pages come from the html listing
+            if page == 1 and engine_for(self._name) == "rss":
+                results = await self._rss_result(
+                    start_time,
+                    self.BASE_URL + "/?page=rss&f=0&c=0_0&q={}".format(query),
+                    session,
+                )
+                if results is not None:
+                    return results
+            page_url = lambda number: self.BASE_URL + "/?f=0&c=0_0&q={}&p={}".format(
+                query, number
+            )
+            return await self.parser_result(
+                start_time, page_url(page), session, page, page_url
+            )
 
-    async def parser_result(self, start_time, url, session):
+    async def parser_result(self, start_time, url, session, page=None, page_url=None):
         html = await Scraper().get_all_results(session, url)
-        results = self._parser(html)
+        results = await parse_executor.run(self._parser, html)
+        if results is not None and page_url is not None:
+            results = await extend_with_pages(
+                results,
+                page,
+                self.LIMIT,
+                lambda number: fetch_parsed(session, page_url(number), self._parser),
+            )
         if results is not None:
             results["time"] = time.time() - start_time
             results["total"] = len(results["data"])
@@ -81,8 +166,14 @@ class NyaaSi:
         return results
 
     async def recent(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
+            if engine_for(self._name) == "rss":
+                results = await self._rss_result(
+                    start_time, self.BASE_URL + "/?page=rss", session
+                )
+                if results is not None:
+                    return results
             url = self.BASE_URL
             return await self.parser_result(start_time, url, session)
@@ -1,21 +1,41 @@
 import re
+import json
+import math
 import time
-import aiohttp
-from bs4 import BeautifulSoup
+from datetime import datetime, timezone
 from helper.html_scraper import Scraper
-from constants.base_url import PIRATEBAY
+from helper.http_session import borrow_session
+from helper.parser_backend import make_soup
+from helper.parse_executor import parse_executor
+from helper.torrent_record import TorrentRecord
+from helper.engines import engine_for
+from helper.normalize import make_magnet, format_size
+from constants.base_url import PIRATEBAY, PIRATEBAY_API
 
 
 class PirateBay:
     _name = "Pirate Bay"
+    # Top level of the apibay category codes (205 = Video > TV shows)
+    API_CATEGORIES = {
+        1: "Audio",
+        2: "Video",
+        3: "Applications",
+        4: "Games",
+        5: "Porn",
+        6: "Other",
+    }
+    API_BROWSE = {"tv": 205}
+    NO_RESULT_HASH = "0" * 40
+
     def __init__(self):
         self.BASE_URL = PIRATEBAY
+        self.API_URL = PIRATEBAY_API
         self.LIMIT = None
 
     def _parser(self, htmls):
         try:
             for html in htmls:
-                soup = BeautifulSoup(html, "html.parser")
+                soup = make_soup(html, self._name)
 
                 my_dict = {"data": []}
                 for tr in soup.find_all("tr")[1:]:
@@ -35,7 +55,7 @@ class PirateBay:
                         dateUploaded = td[2].text
                            
                         my_dict["data"].append(
-                            {
+                            TorrentRecord({
                                 "name": name,
                                 "size": size,
                                 "seeders": seeders,
@@ -48,7 +68,7 @@ class PirateBay:
                                     r"([{a-f\d,A-F\d}]{32,40})\b", magnet
                                 ).group(0),
                                 "magnet": magnet,
-                            }
+                            })
                         )
                     if len(my_dict["data"]) == self.LIMIT:
                         break
@@ -65,16 +85,70 @@ class PirateBay:
         except:
             return None
 
+    def _api_parser(self, payloads, page=1):
+        """
+        Parses the q.php and precompiled top 100 answers, a JSON list of
+        torrents with their info_hash, so the magnet is built, not scraped.
+        The list comes whole, `page` picks its LIMIT sized slice.
+        """
+        try:
+            for payload in payloads:
+                items = [
+                    item
+                    for item in json.loads(payload)
+                    if item["info_hash"] != self.NO_RESULT_HASH
+                ]
+                per_page = self.LIMIT or len(items) or 1
+                my_dict = {
+                    "data": [],
+                    "current_page": page,
+                    "total_pages": max(math.ceil(len(items) / per_page), 1),
+                }
+                for item in items[(page - 1) * per_page : page * per_page]:
+                    category = int(item.get("category") or 0)
+                    my_dict["data"].append(
+                        TorrentRecord({
+                            "name": item["name"],
+                            "size": format_size(item["size"]),
+                            "seeders": item["seeders"],
+                            "leechers": item["leechers"],
+                            "category": self.API_CATEGORIES.get(category // 100, ""),
+                            "uploader": item.get("username", ""),
+                            "url": self.BASE_URL
+                            + "/description.php?id={}".format(item["id"]),
+                            "date": datetime.fromtimestamp(
+                                int(item["added"]), timezone.utc
+                            ).strftime("%Y-%m-%d %H:%M"),
+                            "hash": item["info_hash"],
+                            "magnet": make_magnet(item["info_hash"], item["name"]),
+                        })
+                    )
+                return my_dict
+        except:
+            return None
+
+    async def _api_result(self, start_time, url, session, page=1):
+        payloads = await Scraper().get_all_results(session, url)
+        results = await parse_executor.run(self._api_parser, payloads, page)
+        if results is not None:
+            results["time"] = time.time() - start_time
+            results["total"] = len(results["data"])
+        return results
+
     async def search(self, query, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
+            if engine_for(self._name) == "api":
+                # * q.php answers the 100 best matches at once, pages are slices
+                url = self.API_URL + "/q.php?q={}".format(query)
+                return await self._api_result(start_time, url, session, page)
             url = self.BASE_URL + "/search/{}/{}/99/0".format(query, page)
             return await self.parser_result(start_time, url, session)
 
     async def parser_result(self, start_time, url, session):
         html = await Scraper().get_all_results(session, url)
-        results = self._parser(html)
+        results = await parse_executor.run(self._parser, html)
         if results is not None:
             results["time"] = time.time() - start_time
             results["total"] = len(results["data"])
@@ -82,16 +156,27 @@ class PirateBay:
         return results
 
     async def trending(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
+            if engine_for(self._name) == "api":
+                url = self.API_URL + "/precompiled/data_top100_all.json"
+                return await self._api_result(start_time, url, session)
             url = self.BASE_URL + "/top/all"
             return await self.parser_result(start_time, url, session)
 
     async def recent(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
+            if engine_for(self._name) == "api":
+                if not category:
+                    url = self.API_URL + "/precompiled/data_top100_recent.json"
+                else:
+                    url = self.API_URL + "/q.php?q=category:{}".format(
+                        self.API_BROWSE[category]
+                    )
+                return await self._api_result(start_time, url, session)
             if not category:
                 url = self.BASE_URL + "/recent"
             else:
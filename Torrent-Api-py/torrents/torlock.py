@@ -1,12 +1,14 @@
-import asyncio
 import re
 import time
-import aiohttp
-from bs4 import BeautifulSoup
 from helper.asyncioPoliciesFix import decorator_asyncio_fix
 from helper.html_scraper import Scraper
+from helper.http_session import borrow_session
+from helper.parser_backend import make_soup
+from helper.parse_executor import parse_executor
+from helper.torrent_record import TorrentRecord
+from helper.enrichment import enrich_rows
+from helper.pages import extend_with_pages, fetch_parsed
 from constants.base_url import TORLOCK
-from constants.headers import HEADER_AIO
 
 
 class Torlock:
@@ -18,85 +20,83 @@ class Torlock:
     @decorator_asyncio_fix
     async def _individual_scrap(self, session, url, obj):
         try:
-            # Add timeout to individual requests
-            async with session.get(url, headers=HEADER_AIO, timeout=aiohttp.ClientTimeout(total=10)) as res:
-                html = await res.text(encoding="ISO-8859-1")
-                soup = BeautifulSoup(html, "html.parser")
+            # Timeout adapts to Torlock's observed latency
+            html = await Scraper()._get_html(session, url, encoding="ISO-8859-1")
+            if html is not None:
+                obj.update(await parse_executor.run(self._parse_details, html, url))
 
-                try:
-                    # Pattern-based extraction instead of hardcoded indices
-                    all_links = soup.find_all("a")
-                    magnet = ""
-                    torrent = ""
-                    category = ""
-
-                    for link in all_links:
-                        href = link.get("href", "")
-
-                        if href.startswith("magnet:") and not magnet:
-                            magnet = href
-                        elif (".torrent" in href or "/download/" in href) and not torrent:
-                            torrent = href
-                        elif ("/cat/" in href or "/category/" in href) and not category:
-                            category = link.text.strip()
-
-                    # Validate we got required data
-                    if magnet and str(magnet).startswith("magnet") and torrent:
-                        obj["torrent"] = torrent
-                        obj["magnet"] = magnet
-
-                        # Extract hash
-                        hash_match = re.search(r"([{a-f\d,A-F\d}]{32,40})\b", magnet)
-                        if hash_match:
-                            obj["hash"] = hash_match.group(0)
-
-                        if category:
-                            obj["category"] = category
-
-                        # Extract poster
-                        try:
-                            poster_img = soup.find("img", class_="img-responsive")
-                            if poster_img:
-                                obj["poster"] = poster_img.get("src", "")
-                        except:
-                            pass
-
-                        # Extract screenshots
-                        try:
-                            screenshot_imgs = soup.select(".tab-content img.img-fluid")
-                            if screenshot_imgs:
-                                obj["screenshot"] = [img.get("src", "") for img in screenshot_imgs if img.get("src")]
-                        except:
-                            pass
-                    else:
-                        print(f"[TORLOCK] Failed to extract valid data from {url}")
-
-                except Exception as e:
-                    print(f"[TORLOCK] Error parsing individual page: {e}")
-
-        except asyncio.TimeoutError:
-            print(f"[TORLOCK] Timeout fetching {url}")
         except Exception as e:
             print(f"[TORLOCK] Failed to fetch {url}: {e}")
 
-    async def _get_torrent(self, result, session, urls):
-        tasks = []
-        for idx, url in enumerate(urls):
-            for obj in result["data"]:
-                if obj["url"] == url:
-                    task = asyncio.create_task(
-                        self._individual_scrap(session, url, result["data"][idx])
-                    )
-                    tasks.append(task)
+    def _parse_details(self, html, url):
+        details = {}
+        soup = make_soup(html, self._name)
 
-        # Handle partial failures gracefully
-        await asyncio.gather(*tasks, return_exceptions=True)
-        return result
+        try:
+            # Pattern-based extraction instead of hardcoded indices
+            all_links = soup.find_all("a")
+            magnet = ""
+            torrent = ""
+            category = ""
+
+            for link in all_links:
+                href = link.get("href", "")
+
+                if href.startswith("magnet:") and not magnet:
+                    magnet = href
+                elif (".torrent" in href or "/download/" in href) and not torrent:
+                    torrent = href
+                elif ("/cat/" in href or "/category/" in href) and not category:
+                    category = link.text.strip()
+
+            # Validate we got required data
+            if magnet and str(magnet).startswith("magnet") and torrent:
+                details["torrent"] = torrent
+                details["magnet"] = magnet
+
+                # Extract hash
+                hash_match = re.search(r"([{a-f\d,A-F\d}]{32,40})\b", magnet)
+                if hash_match:
+                    details["hash"] = hash_match.group(0)
+
+                if category:
+                    details["category"] = category
+
+                # Extract poster
+                try:
+                    poster_img = soup.find("img", class_="img-responsive")
+                    if poster_img:
+                        details["poster"] = poster_img.get("src", "")
+                except:
+                    pass
+
+                # Extract screenshots
+                try:
+                    screenshot_imgs = soup.select(".tab-content img.img-fluid")
+                    if screenshot_imgs:
+                        details["screenshot"] = [img.get("src", "") for img in screenshot_imgs if img.get("src")]
+                except:
+                    pass
+            else:
+                print(f"[TORLOCK] Failed to extract valid data from {url}")
+
+        except Exception as e:
+            print(f"[TORLOCK] Error parsing individual page: {e}")
+        return details
+
+    async def _get_torrent(self, result, session, urls):
+        return await enrich_rows(
+            self._name,
+            result,
+            urls,
+            lambda url, obj: self._individual_scrap(session, url, obj),
+            limit=self.LIMIT,
+        )
 
     def _parser(self, htmls, idx=0):
         try:
             for html in htmls:
-                soup = BeautifulSoup(html, "html.parser")
+                soup = make_soup(html, self._name)
                 list_of_urls = []
                 my_dict = {"data": []}
 
@@ -116,14 +116,14 @@ class Torlock:
                         seeders = td[3].get_text(strip=True)
                         leechers = td[4].get_text(strip=True)
                         my_dict["data"].append(
-                            {
+                            TorrentRecord({
                                 "name": name,
                                 "size": size,
                                 "date": date,
                                 "seeders": seeders,
                                 "leechers": leechers,
                                 "url": url,
-                            }
+                            })
                         )
                     if len(my_dict["data"]) == self.LIMIT:
                         break
@@ -143,19 +143,31 @@ class Torlock:
             return None, None
 
     async def search(self, query, page, limit):
-        # Add session-level timeout
-        timeout = aiohttp.ClientTimeout(total=60, connect=10, sock_read=30)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
-            url = self.BASE_URL + "/all/torrents/{}.html?sort=seeds&page={}".format(
-                query, page
+            page_url = lambda number: (
+                self.BASE_URL
+                + "/all/torrents/{}.html?sort=seeds&page={}".format(query, number)
+            )
+            return await self.parser_result(
+                start_time, page_url(page), session, idx=5, page=page, page_url=page_url
             )
-            return await self.parser_result(start_time, url, session, idx=5)
 
-    async def parser_result(self, start_time, url, session, idx=0):
+    async def parser_result(
+        self, start_time, url, session, idx=0, page=None, page_url=None
+    ):
         htmls = await Scraper().get_all_results(session, url)
-        result, urls = self._parser(htmls, idx)
+        result, urls = await parse_executor.run(self._parser, htmls, idx)
+        if result is not None and page_url is not None:
+            result, urls = await extend_with_pages(
+                (result, urls),
+                page,
+                self.LIMIT,
+                lambda number: fetch_parsed(
+                    session, page_url(number), self._parser, idx
+                ),
+            )
         if result is not None:
             results = await self._get_torrent(result, session, urls)
             results["time"] = time.time() - start_time
@@ -164,7 +176,7 @@ class Torlock:
         return result
 
     async def trending(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             if not category:
@@ -176,7 +188,7 @@ class Torlock:
             return await self.parser_result(start_time, url, session)
 
     async def recent(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             if not category:
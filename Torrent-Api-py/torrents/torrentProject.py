@@ -1,12 +1,14 @@
 import asyncio
 import time
-import aiohttp
 import requests
-from bs4 import BeautifulSoup
 from helper.asyncioPoliciesFix import decorator_asyncio_fix
 from helper.html_scraper import Scraper
+from helper.http_session import borrow_session
+from helper.parser_backend import make_soup
+from helper.parse_executor import parse_executor
+from helper.torrent_record import TorrentRecord
+from helper.enrichment import enrich_rows
 from constants.base_url import TORRENTPROJECT
-from constants.headers import HEADER_AIO
 
 
 class TorrentProject:
@@ -19,41 +21,40 @@ class TorrentProject:
     async def _individual_scrap(self, session, url, obj, sem):
         async with sem:
             try:
-                async with session.get(
-                    url,
-                    headers=HEADER_AIO,
-                ) as res:
-                    html = await res.text(encoding="ISO-8859-1")
-                    soup = BeautifulSoup(html, "html.parser")
-                    try:
-                        magnet = soup.select_one(
-                            "#download > div:nth-child(2) > div > a"
-                        )["href"]
-                        index_of_magnet = magnet.index("magnet")
-                        magnet = requests.utils.unquote(magnet[index_of_magnet:])
-                        obj["magnet"] = magnet
-                    except:
-                        ...
+                html = await Scraper()._get_html(session, url, encoding="ISO-8859-1")
+                if html is not None:
+                    obj.update(await parse_executor.run(self._parse_details, html))
             except:
                 return None
 
+    def _parse_details(self, html):
+        details = {}
+        soup = make_soup(html, self._name)
+        try:
+            magnet = soup.select_one(
+                "#download > div:nth-child(2) > div > a"
+            )["href"]
+            index_of_magnet = magnet.index("magnet")
+            magnet = requests.utils.unquote(magnet[index_of_magnet:])
+            details["magnet"] = magnet
+        except:
+            ...
+        return details
+
     async def _get_torrent(self, result, session, urls):
-        tasks = []
         sem = asyncio.Semaphore(3)
-        for idx, url in enumerate(urls):
-            for obj in result["data"]:
-                if obj["url"] == url:
-                    task = asyncio.create_task(
-                        self._individual_scrap(session, url, result["data"][idx], sem)
-                    )
-                    tasks.append(task)
-        await asyncio.gather(*tasks)
-        return result
+        return await enrich_rows(
+            self._name,
+            result,
+            urls,
+            lambda url, obj: self._individual_scrap(session, url, obj, sem),
+            limit=self.LIMIT,
+        )
 
     def _parser(self, htmls):
         try:
             for html in htmls:
-                soup = BeautifulSoup(html, "html.parser")
+                soup = make_soup(html, self._name)
                 list_of_urls = []
                 my_dict = {"data": []}
                 for div in soup.select("div#similarfiles div")[2:]:
@@ -67,14 +68,14 @@ class TorrentProject:
                     size = span[5].text
 
                     my_dict["data"].append(
-                        {
+                        TorrentRecord({
                             "name": name,
                             "size": size,
                             "date": date,
                             "seeders": seeders,
                             "leechers": leechers,
                             "url": url,
-                        }
+                        })
                     )
                     if len(my_dict["data"]) == self.LIMIT:
                         break
@@ -83,7 +84,7 @@ class TorrentProject:
             return None, None
 
     async def search(self, query, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             url = self.BASE_URL + "/?t={}&p={}".format(query, page - 1)
@@ -91,7 +92,7 @@ class TorrentProject:
 
     async def parser_result(self, start_time, url, session):
         htmls = await Scraper().get_all_results(session, url)
-        result, urls = self._parser(htmls)
+        result, urls = await parse_executor.run(self._parser, htmls)
         if result is not None:
             results = await self._get_torrent(result, session, urls)
             results["time"] = time.time() - start_time
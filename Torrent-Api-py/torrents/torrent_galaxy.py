@@ -1,8 +1,11 @@
 import re
 import time
-import aiohttp
-from bs4 import BeautifulSoup
 from helper.html_scraper import Scraper
+from helper.http_session import borrow_session
+from helper.parser_backend import make_soup
+from helper.parse_executor import parse_executor
+from helper.torrent_record import TorrentRecord
+from helper.pages import extend_with_pages, fetch_parsed
 from constants.base_url import TGX
 
 
@@ -14,7 +17,7 @@ class TorrentGalaxy:
 
     def _parser_individual(self, html):
         try:
-            soup = BeautifulSoup(html[0], "html.parser")
+            soup = make_soup(html[0], self._name)
             my_dict = {"data": []}
             root_div = soup.find("div", class_="gluewrapper")
             post_nd_torrents = root_div.find_next("div").find_all("div")
@@ -58,7 +61,7 @@ class TorrentGalaxy:
                 if img["href"].endswith((".png", ".jpg", ".jpeg"))
             ]
             my_dict["data"].append(
-                {
+                TorrentRecord({
                     "name": name,
                     "size": size,
                     "seeders": seeders,
@@ -76,7 +79,7 @@ class TorrentGalaxy:
                     "screenshot": imgs,
                     "genre": genre_list,
                     "date": date_up,
-                }
+                })
             )
             return my_dict
         except:
@@ -85,7 +88,7 @@ class TorrentGalaxy:
     def _parser(self, htmls):
         try:
             for html in htmls:
-                soup = BeautifulSoup(html, "html.parser")
+                soup = make_soup(html, self._name)
 
                 my_dict = {"data": []}
                 for idx, divs in enumerate(soup.find_all("div", class_="tgxtablerow")):
@@ -134,7 +137,7 @@ class TorrentGalaxy:
                         except:
                             category = None
                         my_dict["data"].append(
-                            {
+                            TorrentRecord({
                                 "name": name,
                                 "size": size,
                                 "seeders": seeders,
@@ -149,7 +152,7 @@ class TorrentGalaxy:
                                 "torrent": torrent,
                                 "url": self.BASE_URL + url,
                                 "date": date,
-                            }
+                            })
                         )
                     if len(my_dict["data"]) == self.LIMIT:
                         break
@@ -171,30 +174,41 @@ class TorrentGalaxy:
             return None
 
     async def search(self, query, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
-            url = (
+            page_url = lambda number: (
                 self.BASE_URL
                 + "/torrents.php?search=+{}&sort=seeders&order=desc&page={}".format(
-                    query, page - 1
+                    query, number - 1
                 )
             )
-            return await self.parser_result(start_time, url, session)
+            return await self.parser_result(
+                start_time, page_url(page), session, page=page, page_url=page_url
+            )
 
     async def get_torrent_by_url(self, torrent_url):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             return await self.parser_result(
                 start_time, torrent_url, session, is_individual=True
             )
 
-    async def parser_result(self, start_time, url, session, is_individual=False):
+    async def parser_result(
+        self, start_time, url, session, is_individual=False, page=None, page_url=None
+    ):
         html = await Scraper().get_all_results(session, url)
         if is_individual:
-            results = self._parser_individual(html)
+            results = await parse_executor.run(self._parser_individual, html)
         else:
-            results = self._parser(html)
+            results = await parse_executor.run(self._parser, html)
+        if results is not None and page_url is not None:
+            results = await extend_with_pages(
+                results,
+                page,
+                self.LIMIT,
+                lambda number: fetch_parsed(session, page_url(number), self._parser),
+            )
         if results is not None:
             results["time"] = time.time() - start_time
             results["total"] = len(results["data"])
@@ -202,14 +216,14 @@ class TorrentGalaxy:
         return results
 
     async def trending(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             url = self.BASE_URL
             return await self.parser_result(start_time, url, session)
 
     async def recent(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             if not category:
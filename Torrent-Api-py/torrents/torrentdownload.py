@@ -1,11 +1,18 @@
 import re
 import time
-import aiohttp
-from bs4 import BeautifulSoup
 from helper.html_scraper import Scraper
+from helper.http_session import borrow_session
+from helper.parser_backend import make_soup
+from helper.parse_executor import parse_executor
+from helper.torrent_record import TorrentRecord
+from helper.release_parser import quality_label
+from helper.pages import extend_with_pages, fetch_parsed
 from constants.base_url import TORRENTDOWNLOAD
 from constants.headers import HEADER_AIO
 
+# Bare "HD" tag, not HDTV/HDCAM/HDRip
+HD_TOKEN = re.compile(r"(?<![a-z0-9])hd(?![a-z0-9])", re.IGNORECASE)
+
 class TorrentDownload:
     """
     Scraper for TorrentDownload.info
@@ -17,23 +24,20 @@ class TorrentDownload:
         self.BASE_URL = TORRENTDOWNLOAD
         self.LIMIT = None
 
-    def _extract_quality(self, name):
-        """Extract quality from torrent name"""
-        name_lower = name.lower()
-
-        # Check for common quality indicators in priority order
-        if '2160p' in name_lower or '4k' in name_lower or 'uhd' in name_lower:
-            return '2160p'
-        elif '1080p' in name_lower or 'fullhd' in name_lower or 'fhd' in name_lower:
-            return '1080p'
-        elif '720p' in name_lower or 'hd' in name_lower:
-            return '720p'
-        elif '480p' in name_lower or 'dvdrip' in name_lower or 'xvid' in name_lower:
-            return '480p'
-        elif 'cam' in name_lower or 'ts' in name_lower or 'tc' in name_lower:
-            return 'CAM'
-        else:
-            return 'Unknown'
+    def _extract_quality(self, name, parsed):
+        """
+        Quality of a torrent name: quality_label of the parsed release, else
+        the whole token guesses this field always used (HD -> 720p,
+        DVDRip/XviD -> 480p). Cam releases are never relabelled.
+        """
+        label = quality_label(parsed)
+        if label != "Unknown" or parsed is None:
+            return label
+        if parsed["source"] == "DVDRip" or parsed["codec"] == "XviD":
+            return "480p"
+        if HD_TOKEN.search(name):
+            return "720p"
+        return label
 
     def _parser(self, htmls):
         """
@@ -48,7 +52,7 @@ class TorrentDownload:
         """
         try:
             for html in htmls:
-                soup = BeautifulSoup(html, "html.parser")
+                soup = make_soup(html, self._name)
                 my_dict = {"data": []}
 
                 # Find main results table (skip first table which is "Fast Links")
@@ -140,11 +144,8 @@ class TorrentDownload:
                             if " » " in category_text:
                                 category = category_text.split(" » ")[1].strip()
 
-                        # Extract quality from name
-                        quality = self._extract_quality(name)
-
                         # Build result object
-                        torrent_data = {
+                        torrent_data = TorrentRecord({
                             "name": name,
                             "size": size,
                             "seeders": seeders,
@@ -154,8 +155,10 @@ class TorrentDownload:
                             "url": url,
                             "date": date,
                             "category": category,
-                            "quality": quality
-                        }
+                        })
+                        torrent_data["quality"] = self._extract_quality(
+                            name, torrent_data["parsed"]
+                        )
 
                         my_dict["data"].append(torrent_data)
 
@@ -218,21 +221,34 @@ class TorrentDownload:
         Returns:
             dict: Search results with timing info
         """
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
 
             # URL format: /search?q=QUERY&p=PAGE
-            url = f"{self.BASE_URL}/search?q={query}&p={page}"
+            page_url = lambda number: f"{self.BASE_URL}/search?q={query}&p={number}"
 
-            return await self.parser_result(start_time, url, session)
+            return await self.parser_result(
+                start_time, page_url(page), session, page, page_url
+            )
 
-    async def parser_result(self, start_time, url, session):
+    async def parser_result(self, start_time, url, session, page=None, page_url=None):
         """
         Common method to fetch HTML and parse results
+
+        With `page_url` (page number -> url), the pages still needed to
+        reach the limit are fetched concurrently and merged in order.
         """
         htmls = await Scraper().get_all_results(session, url)
-        result = self._parser(htmls)
+        result = await parse_executor.run(self._parser, htmls)
+
+        if result is not None and page_url is not None:
+            result = await extend_with_pages(
+                result,
+                page,
+                self.LIMIT,
+                lambda number: fetch_parsed(session, page_url(number), self._parser),
+            )
 
         if result is not None:
             result["time"] = time.time() - start_time
@@ -247,7 +263,7 @@ class TorrentDownload:
         TorrentDownload.info doesn't have a trending page,
         so we'll return top results
         """
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
 
@@ -261,7 +277,7 @@ class TorrentDownload:
         Get recent torrents
         Using date sorted search
         """
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
 
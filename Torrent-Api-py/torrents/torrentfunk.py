@@ -1,11 +1,12 @@
-import asyncio
 import time
-import aiohttp
-from bs4 import BeautifulSoup
 from helper.asyncioPoliciesFix import decorator_asyncio_fix
 from helper.html_scraper import Scraper
+from helper.http_session import borrow_session
+from helper.parser_backend import make_soup
+from helper.parse_executor import parse_executor
+from helper.torrent_record import TorrentRecord
+from helper.enrichment import enrich_rows
 from constants.base_url import TORRENTFUNK
-from constants.headers import HEADER_AIO
 
 
 class TorrentFunk:
@@ -17,40 +18,42 @@ class TorrentFunk:
     @decorator_asyncio_fix
     async def _individual_scrap(self, session, url, obj):
         try:
-            async with session.get(url, headers=HEADER_AIO) as res:
-                html = await res.text(encoding="ISO-8859-1")
-                soup = BeautifulSoup(html, "html.parser")
-                try:
-                    obj["torrent"] = soup.select_one(
-                        "#right > main > div.content > table:nth-child(3) > tr > td:nth-child(2) > a"
-                    )["href"]
-                    obj["category"] = soup.select_one(
-                        "#right > main > div.content > table:nth-child(7) > tr> td:nth-child(2) > a"
-                    ).text
-                    obj["hash"] = soup.select_one(
-                        "#right > main > div.content > table:nth-child(7) > tr:nth-child(3) > td:nth-child(2)"
-                    ).text
-                except:
-                    ...
+            html = await Scraper()._get_html(session, url, encoding="ISO-8859-1")
+            if html is not None:
+                obj.update(await parse_executor.run(self._parse_details, html))
         except:
             return None
 
+    def _parse_details(self, html):
+        details = {}
+        soup = make_soup(html, self._name)
+        try:
+            details["torrent"] = soup.select_one(
+                "#right > main > div.content > table:nth-child(3) > tr > td:nth-child(2) > a"
+            )["href"]
+            details["category"] = soup.select_one(
+                "#right > main > div.content > table:nth-child(7) > tr> td:nth-child(2) > a"
+            ).text
+            details["hash"] = soup.select_one(
+                "#right > main > div.content > table:nth-child(7) > tr:nth-child(3) > td:nth-child(2)"
+            ).text
+        except:
+            ...
+        return details
+
     async def _get_torrent(self, result, session, urls):
-        tasks = []
-        for idx, url in enumerate(urls):
-            for obj in result["data"]:
-                if obj["url"] == url:
-                    task = asyncio.create_task(
-                        self._individual_scrap(session, url, result["data"][idx])
-                    )
-                    tasks.append(task)
-        await asyncio.gather(*tasks)
-        return result
+        return await enrich_rows(
+            self._name,
+            result,
+            urls,
+            lambda url, obj: self._individual_scrap(session, url, obj),
+            limit=self.LIMIT,
+        )
 
     def _parser(self, htmls, idx=1):
         try:
             for html in htmls:
-                soup = BeautifulSoup(html, "html.parser")
+                soup = make_soup(html, self._name)
                 list_of_urls = []
                 my_dict = {"data": []}
 
@@ -67,7 +70,7 @@ class TorrentFunk:
                     url = self.BASE_URL + td[0].find("a")["href"]
                     list_of_urls.append(url)
                     my_dict["data"].append(
-                        {
+                        TorrentRecord({
                             "name": name,
                             "size": size,
                             "date": date,
@@ -75,7 +78,7 @@ class TorrentFunk:
                             "leechers": leechers,
                             "uploader": uploader if uploader else None,
                             "url": url,
-                        }
+                        })
                     )
                     if len(my_dict["data"]) == self.LIMIT:
                         break
@@ -84,7 +87,7 @@ class TorrentFunk:
             return None, None
 
     async def search(self, query, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             url = self.BASE_URL + "/all/torrents/{}/{}.html".format(query, page)
@@ -92,7 +95,7 @@ class TorrentFunk:
 
     async def parser_result(self, start_time, url, session, idx=1):
         htmls = await Scraper().get_all_results(session, url)
-        result, urls = self._parser(htmls, idx)
+        result, urls = await parse_executor.run(self._parser, htmls, idx)
         if result:
             results = await self._get_torrent(result, session, urls)
             results["time"] = time.time() - start_time
@@ -101,14 +104,14 @@ class TorrentFunk:
         return result
 
     async def trending(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             url = self.BASE_URL
             return await self.parser_result(start_time, url, session)
 
     async def recent(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             if not category:
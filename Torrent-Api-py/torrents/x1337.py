@@ -1,12 +1,14 @@
-import asyncio
 import re
 import time
-import aiohttp
-from bs4 import BeautifulSoup
 from helper.asyncioPoliciesFix import decorator_asyncio_fix
 from helper.html_scraper import Scraper
+from helper.http_session import borrow_session
+from helper.parser_backend import make_soup
+from helper.parse_executor import parse_executor
+from helper.torrent_record import TorrentRecord
+from helper.enrichment import enrich_rows
+from helper.pages import extend_with_pages, fetch_parsed
 from constants.base_url import X1337
-from constants.headers import HEADER_AIO
 
 
 class x1337:
@@ -18,61 +20,63 @@ class x1337:
     @decorator_asyncio_fix
     async def _individual_scrap(self, session, url, obj):
         try:
-            async with session.get(url, headers=HEADER_AIO) as res:
-                html = await res.text(encoding="ISO-8859-1")
-                soup = BeautifulSoup(html, "html.parser")
-                try:
-                    magnet = soup.select_one(".no-top-radius > div > ul > li > a")[
-                        "href"
-                    ]
-                    uls = soup.find_all("ul", class_="list")[1]
-                    lis = uls.find_all("li")[0]
-                    imgs = [
-                        img["data-original"]
-                        for img in (soup.find("div", id="description")).find_all("img")
-                        if img["data-original"].endswith((".png", ".jpg", ".jpeg"))
-                    ]
-                    files = [
-                        f.text for f in soup.find("div", id="files").find_all("li")
-                    ]
-                    if len(imgs) > 0:
-                        obj["screenshot"] = imgs
-                    obj["category"] = lis.find("span").text
-                    obj["files"] = files
-                    try:
-                        poster = soup.select_one("div.torrent-image img")["src"]
-                        if str(poster).startswith("//"):
-                            obj["poster"] = "https:" + poster
-                        elif str(poster).startswith("/"):
-                            obj["poster"] = self.BASE_URL + poster
-                    except:
-                        ...
-                    obj["magnet"] = magnet
-
-                    obj["hash"] = re.search(
-                        r"([{a-f\d,A-F\d}]{32,40})\b", magnet
-                    ).group(0)
-                except IndexError:
-                    ...
+            html = await Scraper()._get_html(session, url, encoding="ISO-8859-1")
+            if html is not None:
+                obj.update(await parse_executor.run(self._parse_details, html))
         except:
             return None
 
+    def _parse_details(self, html):
+        details = {}
+        soup = make_soup(html, self._name)
+        try:
+            magnet = soup.select_one(".no-top-radius > div > ul > li > a")[
+                "href"
+            ]
+            uls = soup.find_all("ul", class_="list")[1]
+            lis = uls.find_all("li")[0]
+            imgs = [
+                img["data-original"]
+                for img in (soup.find("div", id="description")).find_all("img")
+                if img["data-original"].endswith((".png", ".jpg", ".jpeg"))
+            ]
+            files = [
+                f.text for f in soup.find("div", id="files").find_all("li")
+            ]
+            if len(imgs) > 0:
+                details["screenshot"] = imgs
+            details["category"] = lis.find("span").text
+            details["files"] = files
+            try:
+                poster = soup.select_one("div.torrent-image img")["src"]
+                if str(poster).startswith("//"):
+                    details["poster"] = "https:" + poster
+                elif str(poster).startswith("/"):
+                    details["poster"] = self.BASE_URL + poster
+            except:
+                ...
+            details["magnet"] = magnet
+
+            details["hash"] = re.search(
+                r"([{a-f\d,A-F\d}]{32,40})\b", magnet
+            ).group(0)
+        except IndexError:
+            ...
+        return details
+
     async def _get_torrent(self, result, session, urls):
-        tasks = []
-        for idx, url in enumerate(urls):
-            for obj in result["data"]:
-                if obj["url"] == url:
-                    task = asyncio.create_task(
-                        self._individual_scrap(session, url, result["data"][idx])
-                    )
-                    tasks.append(task)
-        await asyncio.gather(*tasks)
-        return result
+        return await enrich_rows(
+            self._name,
+            result,
+            urls,
+            lambda url, obj: self._individual_scrap(session, url, obj),
+            limit=self.LIMIT,
+        )
 
     def _parser(self, htmls):
         try:
             for html in htmls:
-                soup = BeautifulSoup(html, "html.parser")
+                soup = make_soup(html, self._name)
                 list_of_urls = []
                 my_dict = {"data": []}
                 trs = soup.select("tbody tr")
@@ -89,7 +93,7 @@ class x1337:
                         uploader = td[5].find("a").text
 
                         my_dict["data"].append(
-                            {
+                            TorrentRecord({
                                 "name": name,
                                 "size": size,
                                 "date": date,
@@ -97,7 +101,7 @@ class x1337:
                                 "leechers": leechers,
                                 "url": url,
                                 "uploader": uploader,
-                            }
+                            })
                         )
                     if len(my_dict["data"]) == self.LIMIT:
                         break
@@ -116,52 +120,36 @@ class x1337:
             return None, None
 
     async def search(self, query, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             self.LIMIT = limit
             start_time = time.time()
-            url = self.BASE_URL + "/search/{}/{}/".format(query, page)
+            page_url = lambda number: self.BASE_URL + "/search/{}/{}/".format(
+                query, number
+            )
             return await self.parser_result(
-                start_time, url, session, query=query, page=page
+                start_time, page_url(page), session, page, page_url
             )
 
-    async def parser_result(self, start_time, url, session, page, query=None):
+    async def parser_result(self, start_time, url, session, page, page_url=None):
         htmls = await Scraper().get_all_results(session, url)
-        result, urls = self._parser(htmls)
-        if result is not None:
-            results = await self._get_torrent(result, session, urls)
-            results["time"] = time.time() - start_time
-            results["total"] = len(results["data"])
-            if query is None:
-                return results
-            while True:
-                if len(results["data"]) >= self.LIMIT:
-                    results["data"] = results["data"][0 : self.LIMIT]
-                    results["total"] = len(results["data"])
-                    return results
-                page = page + 1
-                url = self.BASE_URL + "/search/{}/{}/".format(query, page)
-                htmls = await Scraper().get_all_results(session, url)
-                result, urls = self._parser(htmls)
-                if result is not None:
-                    if len(result["data"]) > 0:
-                        res = await self._get_torrent(result, session, urls)
-                        for obj in res["data"]:
-                            results["data"].append(obj)
-                        try:
-                            results["current_page"] = res["current_page"]
-                        except:
-                            ...
-                        results["time"] = time.time() - start_time
-                        results["total"] = len(results["data"])
-                    else:
-                        break
-                else:
-                    break
+        results, urls = await parse_executor.run(self._parser, htmls)
+        if results is None:
             return results
-        return result
+        # * collect every row first, detail pages only for the ones kept
+        if page_url is not None:
+            results, urls = await extend_with_pages(
+                (results, urls),
+                page,
+                self.LIMIT,
+                lambda number: fetch_parsed(session, page_url(number), self._parser),
+            )
+        results = await self._get_torrent(results, session, urls)
+        results["time"] = time.time() - start_time
+        results["total"] = len(results["data"])
+        return results
 
     async def trending(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             if not category:
@@ -171,7 +159,7 @@ class x1337:
             return await self.parser_result(start_time, url, session, page)
 
     async def recent(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             if not category:
@@ -183,10 +171,12 @@ class x1337:
             return await self.parser_result(start_time, url, session, page)
 
     async def search_by_category(self, query, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
-            url = self.BASE_URL + "/category-search/{}/{}/{}/".format(
-                query, category.capitalize(), page
+            page_url = lambda number: self.BASE_URL + "/category-search/{}/{}/{}/".format(
+                query, category.capitalize(), number
+            )
+            return await self.parser_result(
+                start_time, page_url(page), session, page, page_url
             )
-            return await self.parser_result(start_time, url, session, page, query)
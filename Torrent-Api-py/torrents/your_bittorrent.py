@@ -1,11 +1,12 @@
-import asyncio
 import time
-import aiohttp
-from bs4 import BeautifulSoup
 from helper.asyncioPoliciesFix import decorator_asyncio_fix
 from helper.html_scraper import Scraper
+from helper.http_session import borrow_session
+from helper.parser_backend import make_soup
+from helper.parse_executor import parse_executor
+from helper.torrent_record import TorrentRecord
+from helper.enrichment import enrich_rows
 from constants.base_url import YOURBITTORRENT
-from constants.headers import HEADER_AIO
 
 
 class YourBittorrent:
@@ -17,42 +18,44 @@ class YourBittorrent:
     @decorator_asyncio_fix
     async def _individual_scrap(self, session, url, obj):
         try:
-            async with session.get(url, headers=HEADER_AIO) as res:
-                html = await res.text(encoding="ISO-8859-1")
-                soup = BeautifulSoup(html, "html.parser")
-                try:
-                    container = soup.select_one("div.card-body.container")
-                    poster = (
-                        container.find("div")
-                        .find_all("div")[0]
-                        .find("picture")
-                        .find("img")["src"]
-                    )
-                    clearfix = soup.find("div", class_="clearfix")
-                    torrent = clearfix.find("div").find_all("div")[1].find("a")["href"]
-                    obj["torrent"] = torrent
-                    obj["poster"] = poster
-                except:
-                    ...
+            html = await Scraper()._get_html(session, url, encoding="ISO-8859-1")
+            if html is not None:
+                obj.update(await parse_executor.run(self._parse_details, html))
         except:
             return None
 
+    def _parse_details(self, html):
+        details = {}
+        soup = make_soup(html, self._name)
+        try:
+            container = soup.select_one("div.card-body.container")
+            poster = (
+                container.find("div")
+                .find_all("div")[0]
+                .find("picture")
+                .find("img")["src"]
+            )
+            clearfix = soup.find("div", class_="clearfix")
+            torrent = clearfix.find("div").find_all("div")[1].find("a")["href"]
+            details["torrent"] = torrent
+            details["poster"] = poster
+        except:
+            ...
+        return details
+
     async def _get_torrent(self, result, session, urls):
-        tasks = []
-        for idx, url in enumerate(urls):
-            for obj in result["data"]:
-                if obj["url"] == url:
-                    task = asyncio.create_task(
-                        self._individual_scrap(session, url, result["data"][idx])
-                    )
-                    tasks.append(task)
-        await asyncio.gather(*tasks)
-        return result
+        return await enrich_rows(
+            self._name,
+            result,
+            urls,
+            lambda url, obj: self._individual_scrap(session, url, obj),
+            limit=self.LIMIT,
+        )
 
     def _parser(self, htmls, idx=1):
         try:
             for html in htmls:
-                soup = BeautifulSoup(html, "html.parser")
+                soup = make_soup(html, self._name)
                 list_of_urls = []
                 my_dict = {"data": []}
 
@@ -66,14 +69,14 @@ class YourBittorrent:
                     seeders = td[4].text
                     leechers = td[5].text
                     my_dict["data"].append(
-                        {
+                        TorrentRecord({
                             "name": name,
                             "size": size,
                             "date": date,
                             "seeders": seeders,
                             "leechers": leechers,
                             "url": url,
-                        }
+                        })
                     )
                     if len(my_dict["data"]) == self.LIMIT:
                         break
@@ -82,7 +85,7 @@ class YourBittorrent:
             return None, None
 
     async def search(self, query, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             url = self.BASE_URL + "/?v=&c=&q={}".format(query)
@@ -90,7 +93,7 @@ class YourBittorrent:
 
     async def parser_result(self, start_time, url, session, idx=1):
         htmls = await Scraper().get_all_results(session, url)
-        result, urls = self._parser(htmls, idx)
+        result, urls = await parse_executor.run(self._parser, htmls, idx)
         if result is not None:
             results = await self._get_torrent(result, session, urls)
             results["time"] = time.time() - start_time
@@ -99,7 +102,7 @@ class YourBittorrent:
         return result
 
     async def trending(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             idx = None
@@ -114,7 +117,7 @@ class YourBittorrent:
             return await self.parser_result(start_time, url, session, idx)
 
     async def recent(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             idx = None
@@ -1,106 +1,117 @@
-import asyncio
 import re
+import json
+import math
 import time
-import aiohttp
-from bs4 import BeautifulSoup
 from helper.asyncioPoliciesFix import decorator_asyncio_fix
 from helper.html_scraper import Scraper
+from helper.http_session import borrow_session
+from helper.parser_backend import make_soup
+from helper.parse_executor import parse_executor
+from helper.torrent_record import TorrentRecord
+from helper.enrichment import enrich_rows
+from helper.engines import engine_for
+from helper.normalize import make_magnet
 from constants.base_url import YTS
-from constants.headers import HEADER_AIO
 
 
 class Yts:
     _name = "YTS"
+    API_PAGE_SIZE = 20
+    QUALITY_TYPES = {"bluray": "BluRay", "web": "WEB"}
+
     def __init__(self):
         self.BASE_URL = YTS
+        self.API_URL = YTS + "/api/v2"
         self.LIMIT = None
 
     @decorator_asyncio_fix
     async def _individual_scrap(self, session, url, obj):
         try:
-            async with session.get(url, headers=HEADER_AIO) as res:
-                html = await res.text(encoding="ISO-8859-1")
-                soup = BeautifulSoup(html, "html.parser")
-                try:
-                    name = soup.select_one("div.hidden-xs h1").text
-                    div = soup.select("div.hidden-xs h2")
-                    date = div[0].text
-                    genre = div[1].text.split("/")
-                    rating = soup.select_one("[itemprop=ratingValue]").text
-                    poster = (
-                        soup.find("div", id="movie-poster")
-                        .find("img")["src"]
-                        .split("/")
-                    )
-                    poster[-1] = poster[-1].replace("medium", "large")
-                    poster = "/".join(poster)
-                    description = soup.select("div#synopsis > p")[0].text.strip()
-                    runtime = (
-                        soup.select_one(".tech-spec-info")
-                        .find_all("div", class_="row")[-1]
-                        .find_all("div")[-3]
-                        .text.strip()
-                    )
-
-                    screenshots = soup.find_all("a", class_="screenshot-group")
-                    screenshots = [a["href"] for a in screenshots]
-                    torrents = []
-                    for div in soup.find_all("div", class_="modal-torrent"):
-                        quality = (
-                            div.find("div", class_="modal-quality").find("span").text
-                        )
-                        all_p = div.find_all("p", class_="quality-size")
-                        quality_type = all_p[0].text
-                        size = all_p[1].text
-                        torrent_link = div.find("a", class_="download-torrent")["href"]
-                        magnet = div.find("a", class_="magnet-download")["href"]
-                        hash = re.search(r"([{a-f\d,A-F\d}]{32,40})\b", magnet).group(0)
-                        torrents.append(
-                            {
-                                "quality": quality,
-                                "type": quality_type,
-                                "size": size,
-                                "torrent": torrent_link,
-                                "magnet": magnet,
-                                "hash": hash,
-                            }
-                        )
-                    obj["name"] = name
-                    obj["date"] = date
-                    obj["genre"] = genre
-                    obj["rating"] = rating
-                    obj["poster"] = poster
-                    obj["description"] = description
-                    obj["runtime"] = runtime
-                    obj["screenshot"] = screenshots
-                    obj["torrents"] = torrents
-                except:
-                    ...
+            html = await Scraper()._get_html(session, url, encoding="ISO-8859-1")
+            if html is not None:
+                obj.update(await parse_executor.run(self._parse_details, html))
         except:
             return None
 
+    def _parse_details(self, html):
+        details = {}
+        soup = make_soup(html, self._name)
+        try:
+            name = soup.select_one("div.hidden-xs h1").text
+            div = soup.select("div.hidden-xs h2")
+            date = div[0].text
+            genre = div[1].text.split("/")
+            rating = soup.select_one("[itemprop=ratingValue]").text
+            poster = (
+                soup.find("div", id="movie-poster")
+                .find("img")["src"]
+                .split("/")
+            )
+            poster[-1] = poster[-1].replace("medium", "large")
+            poster = "/".join(poster)
+            description = soup.select("div#synopsis > p")[0].text.strip()
+            runtime = (
+                soup.select_one(".tech-spec-info")
+                .find_all("div", class_="row")[-1]
+                .find_all("div")[-3]
+                .text.strip()
+            )
+
+            screenshots = soup.find_all("a", class_="screenshot-group")
+            screenshots = [a["href"] for a in screenshots]
+            torrents = []
+            for div in soup.find_all("div", class_="modal-torrent"):
+                quality = (
+                    div.find("div", class_="modal-quality").find("span").text
+                )
+                all_p = div.find_all("p", class_="quality-size")
+                quality_type = all_p[0].text
+                size = all_p[1].text
+                torrent_link = div.find("a", class_="download-torrent")["href"]
+                magnet = div.find("a", class_="magnet-download")["href"]
+                hash = re.search(r"([{a-f\d,A-F\d}]{32,40})\b", magnet).group(0)
+                torrents.append(
+                    {
+                        "quality": quality,
+                        "type": quality_type,
+                        "size": size,
+                        "torrent": torrent_link,
+                        "magnet": magnet,
+                        "hash": hash,
+                    }
+                )
+            details["name"] = name
+            details["date"] = date
+            details["genre"] = genre
+            details["rating"] = rating
+            details["poster"] = poster
+            details["description"] = description
+            details["runtime"] = runtime
+            details["screenshot"] = screenshots
+            details["torrents"] = torrents
+        except:
+            ...
+        return details
+
     async def _get_torrent(self, result, session, urls):
-        tasks = []
-        for idx, url in enumerate(urls):
-            for obj in result["data"]:
-                if obj["url"] == url:
-                    task = asyncio.create_task(
-                        self._individual_scrap(session, url, result["data"][idx])
-                    )
-                    tasks.append(task)
-        await asyncio.gather(*tasks)
-        return result
+        return await enrich_rows(
+            self._name,
+            result,
+            urls,
+            lambda url, obj: self._individual_scrap(session, url, obj),
+            limit=self.LIMIT,
+        )
 
     def _parser(self, htmls):
         try:
             for html in htmls:
-                soup = BeautifulSoup(html, "html.parser")
+                soup = make_soup(html, self._name)
                 list_of_urls = []
                 my_dict = {"data": []}
                 for div in soup.find_all("div", class_="browse-movie-wrap"):
                     url = div.find("a")["href"]
                     list_of_urls.append(url)
-                    my_dict["data"].append({"url": url})
+                    my_dict["data"].append(TorrentRecord({"url": url}))
                     if len(my_dict["data"]) == self.LIMIT:
                         break
                 try:
@@ -126,10 +137,94 @@ class Yts:
         except:
             return None, None
 
+    def _api_row(self, movie):
+        runtime = movie.get("runtime") or 0
+        torrents = []
+        for torrent in movie.get("torrents") or []:
+            if not torrent.get("hash"):
+                continue
+            torrents.append(
+                {
+                    "quality": torrent.get("quality"),
+                    "type": self.QUALITY_TYPES.get(torrent.get("type"), torrent.get("type")),
+                    "size": torrent.get("size"),
+                    "torrent": torrent.get("url"),
+                    "magnet": make_magnet(torrent["hash"], movie.get("title_long")),
+                    "hash": torrent["hash"],
+                    "seeders": torrent.get("seeds"),
+                    "leechers": torrent.get("peers"),
+                }
+            )
+        return TorrentRecord(
+            {
+                "url": movie.get("url"),
+                "name": movie.get("title"),
+                "date": str(movie.get("year", "")),
+                "genre": movie.get("genres") or [],
+                "rating": str(movie.get("rating", "")),
+                "poster": movie.get("large_cover_image"),
+                "description": movie.get("description_full") or movie.get("summary"),
+                "runtime": "{} hr {} min".format(runtime // 60, runtime % 60),
+                "torrents": torrents,
+            }
+        )
+
+    def _api_parser(self, payloads):
+        """
+        Parses list_movies.json and movie_details.json answers: every torrent
+        with its hash, quality and size comes in the one response, no detail
+        page is needed.
+        """
+        try:
+            for payload in payloads:
+                data = json.loads(payload)["data"]
+                my_dict = {"data": []}
+                if "movie" in data:
+                    movies = [data["movie"]]
+                    my_dict["current_page"] = my_dict["total_pages"] = 1
+                else:
+                    movies = data.get("movies") or []
+                    my_dict["current_page"] = data.get("page_number", 1)
+                    my_dict["total_pages"] = max(
+                        math.ceil(data.get("movie_count", 0) / self.API_PAGE_SIZE), 1
+                    )
+                for movie in movies:
+                    if not movie.get("url"):
+                        continue
+                    my_dict["data"].append(self._api_row(movie))
+                    if len(my_dict["data"]) == self.LIMIT:
+                        break
+                return my_dict
+        except:
+            return None
+
+    async def _api_result(self, start_time, url, session):
+        payloads = await Scraper().get_all_results(session, url)
+        results = await parse_executor.run(self._api_parser, payloads)
+        if results is not None:
+            results["time"] = time.time() - start_time
+            results["total"] = len(results["data"])
+        return results
+
+    def _api_url(self, query, page, sort_by):
+        if query and re.match(r"^tt\d+$", query):
+            # * IMDb id, one movie
+            return self.API_URL + "/movie_details.json?imdb_id={}".format(query)
+        url = self.API_URL + "/list_movies.json?limit={}&page={}&sort_by={}".format(
+            self.API_PAGE_SIZE, page, sort_by
+        )
+        if query:
+            url += "&query_term={}".format(query)
+        return url
+
     async def search(self, query, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
+            if engine_for(self._name) == "api":
+                return await self._api_result(
+                    start_time, self._api_url(query, page, "date_added"), session
+                )
             if page != 1:
                 url = (
                     self.BASE_URL
@@ -145,7 +240,7 @@ class Yts:
 
     async def parser_result(self, start_time, url, session):
         htmls = await Scraper().get_all_results(session, url)
-        result, urls = self._parser(htmls)
+        result, urls = await parse_executor.run(self._parser, htmls)
         if result is not None:
             results = await self._get_torrent(result, session, urls)
             results["time"] = time.time() - start_time
@@ -154,16 +249,20 @@ class Yts:
         return result
 
     async def trending(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             url = self.BASE_URL + "/trending-movies"
             return await self.parser_result(start_time, url, session)
 
     async def recent(self, category, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
+            if engine_for(self._name) == "api":
+                return await self._api_result(
+                    start_time, self._api_url(None, page, "date_added"), session
+                )
             if page != 1:
                 url = (
                     self.BASE_URL
@@ -1,8 +1,10 @@
 import re
 import time
-import aiohttp
-from bs4 import BeautifulSoup
 from helper.html_scraper import Scraper
+from helper.http_session import borrow_session
+from helper.parser_backend import make_soup
+from helper.parse_executor import parse_executor
+from helper.torrent_record import TorrentRecord
 from constants.base_url import ZOOQLE
 
 
@@ -15,7 +17,7 @@ class Zooqle:
     def _parser(self, htmls):
         try:
             for html in htmls:
-                soup = BeautifulSoup(html, "html.parser")
+                soup = make_soup(html, self._name)
 
                 my_dict = {"data": []}
 
@@ -34,7 +36,7 @@ class Zooqle:
                         seeders = seeders_leechers[0].replace("Seeders: ", "").strip()
                         leechers = seeders_leechers[1].replace("Leechers: ", "").strip()
                         my_dict["data"].append(
-                            {
+                            TorrentRecord({
                                 "name": name,
                                 "size": size,
                                 "seeders": seeders,
@@ -45,7 +47,7 @@ class Zooqle:
                                 "magnet": magnet,
                                 "url": self.BASE_URL + url,
                                 "date": date,
-                            }
+                            })
                         )
                     if len(my_dict["data"]) == self.LIMIT:
                         break
@@ -63,7 +65,7 @@ class Zooqle:
             return None
 
     async def search(self, query, page, limit):
-        async with aiohttp.ClientSession() as session:
+        async with borrow_session(self.BASE_URL) as session:
             start_time = time.time()
             self.LIMIT = limit
             url = self.BASE_URL + "/search?pg={1}&q={0}&v=t".format(query, page)
@@ -71,7 +73,7 @@ class Zooqle:
 
     async def parser_result(self, start_time, url, session):
         html = await Scraper().get_all_results(session, url)
-        results = self._parser(html)
+        results = await parse_executor.run(self._parser, html)
         if results is not None:
             results["time"] = time.time() - start_time
             results["total"] = len(results["data"])